@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, date
+from functools import lru_cache
+import os
 from pathlib import Path
 import re
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from .log_kinds import normalize_kind
 
@@ -21,7 +23,7 @@ _LOG_NAME_PATTERN = re.compile(
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LogFileInfo:
     """Parsed details about a log file path."""
 
@@ -95,19 +97,53 @@ def discover_logs(logs_dir: Path, kind: str) -> List[LogFileInfo]:
     legacy aliases (for example ``smtpLog`` or ``imapLog``).
     """
 
-    if not logs_dir.exists():
-        return []
-
     requested_kind = normalize_kind(kind)
-    infos: list[LogFileInfo] = []
-    for path in logs_dir.iterdir():
-        if not path.is_file():
-            continue
-        info = parse_log_filename(path)
-        if info.kind != requested_kind:
-            continue
-        infos.append(info)
+    infos = [
+        info for info in _scan_logs(logs_dir) if info.kind == requested_kind
+    ]
+    _sort_newest_first(infos)
+    return infos
 
+
+def group_logs_by_kind(logs_dir: Path) -> dict[str, list[LogFileInfo]]:
+    """Return recognised logs in ``logs_dir`` grouped by kind.
+
+    Each group is ordered like :func:`discover_logs`, but the directory is
+    scanned once for all kinds.
+    """
+
+    grouped: dict[str, list[LogFileInfo]] = {}
+    setdefault = grouped.setdefault
+    for info in _scan_logs(logs_dir):
+        setdefault(info.kind, []).append(info)
+    for infos in grouped.values():
+        _sort_newest_first(infos)
+    return grouped
+
+
+def _scan_logs(logs_dir: Path) -> Iterator[LogFileInfo]:
+    if not logs_dir.exists():
+        return
+    # Bind the per-entry callables once; large log folders hit them often.
+    parse = _parse_log_path
+    make_path = Path
+    with os.scandir(logs_dir) as entries:
+        for entry in entries:
+            # scandir reports the entry type without a stat per file.
+            if not entry.is_file():
+                continue
+            info = parse(make_path(entry.path))
+            if info.kind:
+                yield info
+
+
+@lru_cache(maxsize=4096)
+def _parse_log_path(path: Path) -> LogFileInfo:
+    # Parsing depends only on the filename, so rescans reuse it.
+    return parse_log_filename(path)
+
+
+def _sort_newest_first(infos: list[LogFileInfo]) -> None:
     infos.sort(
         key=lambda item: (
             item.stamp or date.min,
@@ -116,7 +152,6 @@ def discover_logs(logs_dir: Path, kind: str) -> List[LogFileInfo]:
         ),
         reverse=True,
     )
-    return infos
 
 
 def newest_log(logs_dir: Path, kind: str) -> Optional[LogFileInfo]:
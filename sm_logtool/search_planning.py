@@ -4,10 +4,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from .search_modes import MODE_FUZZY, MODE_REGEX
+
 
 _SMALL_TWO_TARGET_BYTES = 96 * 1024 * 1024
 _SMALL_PER_TARGET_BYTES = 48 * 1024 * 1024
 _MEDIUM_TOTAL_BYTES = 512 * 1024 * 1024
+_PROCESS_POOL_MIN_BYTES = 8 * 1024 * 1024
+_CPU_BOUND_MODES = frozenset({MODE_FUZZY, MODE_REGEX})
 
 
 @dataclass(frozen=True)
@@ -61,3 +65,36 @@ def choose_search_execution_plan(
         return SearchExecutionPlan(2, "medium workload")
 
     return SearchExecutionPlan(bounded_workers, "large workload")
+
+
+def should_skip_process_pool(total_bytes: int | None) -> bool:
+    """Return whether a workload is too small to justify worker processes.
+
+    Unknown sizes (``None`` or non-positive) never skip the process pool.
+    """
+
+    if total_bytes is None or total_bytes <= 0:
+        return False
+    return total_bytes < _PROCESS_POOL_MIN_BYTES
+
+
+def prefers_process_pool(
+    mode: str,
+    target_count: int,
+    workers: int,
+    total_bytes: int | None,
+) -> bool:
+    """Return whether a parallel search should start on worker processes.
+
+    Fuzzy and regex scans are CPU-bound and serialise on the GIL in
+    threads. They go to processes only when every worker gets a target
+    and the workload is big enough to repay interpreter startup.
+    """
+
+    if mode not in _CPU_BOUND_MODES:
+        return False
+    if workers < 2 or target_count < workers:
+        return False
+    if total_bytes is None or total_bytes <= 0:
+        return False
+    return not should_skip_process_pool(total_bytes)
@@ -71,6 +71,24 @@ _STATUS_GOOD = re.compile(
     re.IGNORECASE,
 )
 
+_HEADER_NAME = re.compile(r"^===\s+(?P<name>.+?)\s+===$")
+_SUMMARY_TERM = re.compile(r"'([^']+)'")
+_RSP_PREFIX = re.compile(r"\brsp:\s*", re.IGNORECASE)
+
+# Message patterns with a literal every match must contain, so a cheap
+# substring test can skip the regex scan on lines that cannot match.
+_MESSAGE_PATTERNS: tuple[tuple[re.Pattern[str], str, str | None], ...] = (
+    (_CMD_RSP, TOKEN_COMMAND, ":"),
+    (_SMTP_VERB, TOKEN_COMMAND, None),
+    (_STATUS_BAD, TOKEN_STATUS_BAD, None),
+    (_STATUS_BLOCKED_OUTCOME, TOKEN_STATUS_BAD, None),
+    (_STATUS_GOOD, TOKEN_STATUS_GOOD, None),
+    (_EMAIL, TOKEN_EMAIL, "@"),
+    (_IP, TOKEN_IP, "."),
+    (_MESSAGE_ID, TOKEN_MESSAGE_ID, "<"),
+    (_BRACKET_TAG, TOKEN_TAG, "["),
+)
+
 _PROTOCOL_TOKENS = {
     "SMTP": TOKEN_PROTO_SMTP,
     "IMAP": TOKEN_PROTO_IMAP,
@@ -130,7 +148,7 @@ def spans_for_line(kind: str, line: str) -> list[HighlightSpan]:
 
 def _header_spans(line: str) -> list[HighlightSpan]:
     spans = [HighlightSpan(0, len(line), TOKEN_HEADER)]
-    match = re.match(r"^===\s+(?P<name>.+?)\s+===$", line)
+    match = _HEADER_NAME.match(line)
     if match:
         spans.append(
             HighlightSpan(
@@ -144,7 +162,7 @@ def _header_spans(line: str) -> list[HighlightSpan]:
 
 def _summary_spans(line: str) -> list[HighlightSpan]:
     spans = [HighlightSpan(0, len(line), TOKEN_SUMMARY)]
-    match = re.search(r"'([^']+)'", line)
+    match = _SUMMARY_TERM.search(line)
     if match:
         spans.append(
             HighlightSpan(
@@ -268,25 +286,18 @@ def _field_token(value: str) -> str:
 
 def _message_spans(line: str, offset: int) -> list[HighlightSpan]:
     spans: list[HighlightSpan] = []
-    spans.extend(_response_code_spans(line, offset))
-    for pattern, token in (
-        (_CMD_RSP, TOKEN_COMMAND),
-        (_SMTP_VERB, TOKEN_COMMAND),
-        (_STATUS_BAD, TOKEN_STATUS_BAD),
-        (_STATUS_BLOCKED_OUTCOME, TOKEN_STATUS_BAD),
-        (_STATUS_GOOD, TOKEN_STATUS_GOOD),
-        (_EMAIL, TOKEN_EMAIL),
-        (_IP, TOKEN_IP),
-        (_MESSAGE_ID, TOKEN_MESSAGE_ID),
-        (_BRACKET_TAG, TOKEN_TAG),
-    ):
+    if ":" in line:
+        spans.extend(_response_code_spans(line, offset))
+    for pattern, token, required in _MESSAGE_PATTERNS:
+        if required is not None and required not in line:
+            continue
         spans.extend(_regex_spans(pattern, line, token, offset))
     return spans
 
 
 def _response_code_spans(line: str, offset: int) -> list[HighlightSpan]:
     spans: list[HighlightSpan] = []
-    for rsp_match in re.finditer(r"\brsp:\s*", line, re.IGNORECASE):
+    for rsp_match in _RSP_PREFIX.finditer(line):
         payload_start = rsp_match.end()
         code_match = _RSP_STATUS_CODE.search(line[payload_start:])
         if code_match is None:
@@ -3,26 +3,41 @@
 from __future__ import annotations
 
 import base64
-import inspect
-from collections import defaultdict
+import io
+from collections import defaultdict, deque
 from concurrent.futures import (
-    FIRST_COMPLETED,
+    BrokenExecutor,
+    Executor,
+    Future,
     ProcessPoolExecutor,
     ThreadPoolExecutor,
-    wait,
+    TimeoutError as FutureTimeoutError,
+    as_completed,
 )
 from dataclasses import dataclass, replace
 from datetime import date, datetime
 from enum import Enum, auto
-from functools import partial
-from itertools import groupby
+from functools import lru_cache, partial
+from itertools import groupby, islice
 import multiprocessing as mp
 import os
 from pathlib import Path
 import re
 import sys
+import threading
 import time
-from typing import Callable, Dict, Iterable, List, Mapping, Optional
+from typing import (
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    cast,
+)
 
 from textual import events
 from textual.app import App, ComposeResult
@@ -30,9 +45,10 @@ from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.geometry import Offset
 from textual.message import Message
-from textual.reactive import reactive
 from textual.screen import ModalScreen
 from textual.selection import Selection
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.worker import Worker
 from textual.worker import WorkerCancelled
 from textual.worker import WorkerState
@@ -47,15 +63,16 @@ from textual.widgets import (
     TextArea,
 )
 from textual.widgets._footer import FooterKey, FooterLabel, KeyGroup
+from rich.console import Group
 from rich.text import Text
 
 from ..config import ConfigError, save_theme
 from ..log_kinds import KIND_DELIVERY, KIND_SMTP, normalize_kind
 from ..logfiles import (
     find_log_by_date,
+    group_logs_by_kind,
     LogFileInfo,
     parse_log_filename,
-    summarize_logs,
 )
 from ..result_rendering import render_search_results
 from ..result_modes import normalize_result_mode
@@ -80,6 +97,8 @@ from ..search import get_search_function
 from ..search import has_search_index
 from ..search import prime_search_index
 from ..search_planning import choose_search_execution_plan
+from ..search_planning import prefers_process_pool
+from ..search_planning import should_skip_process_pool
 from ..syntax import HighlightSpan, spans_for_line
 from ..syntax import TOKEN_LINK
 from ..syntax import TOKEN_LINK_HOVER
@@ -116,12 +135,70 @@ except ImportError:  # pragma: no cover - textual>=6 renames widgets
             _BaseLog = None
 
 
+_OUTPUT_LOG_MAX_LINES = 100_000
+_SELECTION_MOVE_INTERVAL = 0.016
+# Key alias -> (dx, dy, extend selection) for OutputLog cursor movement.
+_CURSOR_KEY_STEPS: dict[str, tuple[int, int, bool]] = {
+    "up": (0, -1, False),
+    "down": (0, 1, False),
+    "left": (-1, 0, False),
+    "right": (1, 0, False),
+    "shift+up": (0, -1, True),
+    "shift+down": (0, 1, True),
+    "shift+left": (-1, 0, True),
+    "shift+right": (1, 0, True),
+}
+
+
+def _update_selections(
+    screen,
+    widget: Widget,
+    selection: Selection | None,
+) -> None:
+    """Set or clear ``widget``'s entry in ``screen.selections``.
+
+    Setting mutates in place and notifies watchers when ``mutate_reactive``
+    exists; otherwise a changed copy is assigned. Clearing always assigns
+    a new dict: the watcher only notifies widgets found in the old or new
+    value, so a widget popped in place would keep its highlight.
+    """
+
+    if selection is None:
+        screen.selections = {
+            key: value
+            for key, value in screen.selections.items()
+            if key is not widget
+        }
+        return
+    mutate = getattr(screen, "mutate_reactive", None)
+    field = getattr(type(screen), "selections", None)
+    if callable(mutate) and field is not None:
+        screen.selections[widget] = selection
+        mutate(field)
+    else:
+        selections = dict(screen.selections)
+        selections[widget] = selection
+        screen.selections = selections
+
+
 if _BaseLog is not None:
 
+    # Keywords not every Log variant accepts; dropped when rejected.
+    _OPTIONAL_LOG_KWARGS = ("markup", "wrap", "highlight", "max_lines")
+    _UNEXPECTED_KWARG = re.compile(r"unexpected keyword argument '(\w+)'")
+    _BASE_LOG_NAME = getattr(_BaseLog, "__name__", "")
+    _BASE_LOG_NEEDS_NEWLINE = _BASE_LOG_NAME in {"TextLog", "Log"}
+    _BASE_LOG_CUSTOM_SELECTION = (
+        not callable(getattr(_BaseLog, "on_mouse_down", None))
+        or _BASE_LOG_NAME == "RichLog"
+    )
+
     class OutputLog(_BaseLog):
         """Text log widget that adapts to Textual version differences."""
 
         can_focus = True
+        # Optional keywords the base rejected; learned on first construction.
+        _rejected_kwargs: tuple[str, ...] = ()
 
         def __init__(
             self,
@@ -129,32 +206,44 @@ if _BaseLog is not None:
             id: str | None = None,
             classes: str | None = None,
         ) -> None:
-            kwargs = {}
-            init_sig = inspect.signature(_BaseLog.__init__)
-            if "highlight" in init_sig.parameters:
-                kwargs["highlight"] = False
-            self._prefer_markup = False
-            if "markup" in init_sig.parameters:
-                kwargs["markup"] = True
-                self._prefer_markup = True
-            if "wrap" in init_sig.parameters:
-                kwargs["wrap"] = True
-            if "id" in init_sig.parameters:
-                kwargs["id"] = id
-            if "classes" in init_sig.parameters:
-                kwargs["classes"] = classes
-            super().__init__(**kwargs)  # type: ignore[arg-type]
+            kwargs: dict[str, object] = {
+                "highlight": False,
+                "markup": True,
+                "wrap": True,
+                "max_lines": _OUTPUT_LOG_MAX_LINES,
+                "id": id,
+                "classes": classes,
+            }
+            for key in OutputLog._rejected_kwargs:
+                kwargs.pop(key, None)
+            while True:
+                try:
+                    super().__init__(**kwargs)  # type: ignore[arg-type]
+                    break
+                except TypeError as exc:
+                    # Argument binding fails before the base body runs.
+                    match = _UNEXPECTED_KWARG.search(str(exc))
+                    key = match.group(1) if match else None
+                    if key not in _OPTIONAL_LOG_KWARGS or key not in kwargs:
+                        raise
+                    kwargs.pop(key)
+            OutputLog._rejected_kwargs = tuple(
+                key for key in _OPTIONAL_LOG_KWARGS if key not in kwargs
+            )
+            self._prefer_markup = "markup" in kwargs
             self._selection_anchor: Offset | None = None
             self._selection_cursor: Offset | None = None
             self._cursor_only = False
             self._mouse_selecting = False
             self._mouse_dragged = False
-            self._use_custom_selection = not callable(
-                getattr(_BaseLog, "on_mouse_down", None),
+            self._last_move_ts = 0.0
+            self._drag_update_pending = False
+            self._use_custom_selection = _BASE_LOG_CUSTOM_SELECTION
+            self._plain_lines: deque[str] = deque(
+                maxlen=_OUTPUT_LOG_MAX_LINES,
             )
-            if getattr(_BaseLog, "__name__", "") == "RichLog":
-                self._use_custom_selection = True
-            self._plain_lines: list[str] = []
+            self._write_buffer: list[str | Text] = []
+            self._flush_scheduled = False
             if hasattr(self, "markup"):
                 try:
                     self.markup = True  # type: ignore[attr-defined]
@@ -169,20 +258,19 @@ if _BaseLog is not None:
                 screen = self.screen
             except Exception:
                 return
-            selections = dict(screen.selections)
-            if self in selections:
-                del selections[self]
-                screen.selections = selections
+            if self in screen.selections:
+                _update_selections(screen, self, None)
             self._selection_anchor = None
             self._selection_cursor = None
             self._cursor_only = False
 
         def clear(self) -> None:  # type: ignore[override]
+            self._write_buffer.clear()
             try:
                 super().clear()  # type: ignore[misc]
             except Exception:
                 pass
-            self._plain_lines = []
+            self._plain_lines.clear()
 
         def write_line(self, line: str | Text) -> None:
             if isinstance(line, Text):
@@ -204,14 +292,34 @@ if _BaseLog is not None:
                 else:
                     payload = plain
 
-            needs_newline = getattr(_BaseLog, "__name__", "") in {
-                "TextLog",
-                "Log",
-            }
-            if needs_newline and isinstance(payload, str):
+            if _BASE_LOG_NEEDS_NEWLINE and isinstance(payload, str):
                 if not payload.endswith("\n"):
                     payload = f"{payload}\n"
-            self.write(payload)  # type: ignore[arg-type]
+            self._write_buffer.append(payload)
+            if len(self._write_buffer) >= _LIVE_MATCH_BATCH_SIZE:
+                self._flush_write_buffer()
+            elif not self._flush_scheduled:
+                try:
+                    self.call_after_refresh(self._flush_write_buffer)
+                except Exception:
+                    self._flush_write_buffer()
+                else:
+                    self._flush_scheduled = True
+
+        def _flush_write_buffer(self) -> None:
+            self._flush_scheduled = False
+            if not self._write_buffer:
+                return
+            pending = self._write_buffer
+            self._write_buffer = []
+            if _BASE_LOG_NEEDS_NEWLINE and all(
+                isinstance(payload, str) for payload in pending
+            ):
+                # Newline-terminated rows can go to the widget in one write.
+                self.write("".join(pending))  # type: ignore[arg-type]
+                return
+            for payload in pending:
+                self.write(payload)  # type: ignore[arg-type]
 
         def cursor_only_selection(self) -> bool:
             return self._cursor_only
@@ -225,9 +333,10 @@ if _BaseLog is not None:
                 screen = self.screen
             except Exception:
                 return
-            selections = dict(screen.selections)
-            selections[self] = Selection.from_offsets(start, end)
-            screen.selections = selections
+            selection = Selection.from_offsets(start, end)
+            if screen.selections.get(self) == selection:
+                return
+            _update_selections(screen, self, selection)
 
         def _line_text(self, line: object) -> str:
             plain = getattr(line, "plain", None)
@@ -235,13 +344,19 @@ if _BaseLog is not None:
                 return plain
             return str(line)
 
-        def _get_lines(self) -> list[object]:
+        def _get_lines(self) -> Sequence[str]:
+            self._flush_write_buffer()
+            # write_line mirrors every row into _plain_lines, so use it
+            # directly unless the base widget was written to another way.
+            if len(self._plain_lines) == self._line_count():
+                return self._plain_lines
             lines = getattr(self, "lines", None)
             if isinstance(lines, list):
-                return lines
+                return [self._line_text(line) for line in lines]
             return self._plain_lines
 
         def _line_count(self) -> int:
+            self._flush_write_buffer()
             count = getattr(self, "line_count", None)
             if isinstance(count, int):
                 return count
@@ -292,24 +407,24 @@ if _BaseLog is not None:
             if not lines:
                 return None
             if start.y == end.y:
-                line = self._line_text(lines[start.y])
-                return line[start.x:end.x] or None
-            parts: list[str] = []
-            first_line = self._line_text(lines[start.y])
-            parts.append(first_line[start.x:])
-            for line_idx in range(start.y + 1, end.y):
-                parts.append(self._line_text(lines[line_idx]))
-            last_line = self._line_text(lines[end.y])
-            parts.append(last_line[:end.x])
-            text = "\n".join(parts)
+                return lines[start.y][start.x:end.x] or None
+            # Grow one buffer instead of building a list of rows to join.
+            buffer = io.StringIO()
+            buffer.write(lines[start.y][start.x:])
+            # islice walks a deque once; indexing it per row would not.
+            for line in islice(lines, start.y + 1, end.y):
+                buffer.write("\n")
+                buffer.write(line)
+            buffer.write("\n")
+            buffer.write(lines[end.y][:end.x])
+            text = buffer.getvalue()
             return text or None
 
         def get_all_text(self) -> str | None:
             lines = self._get_lines()
             if not lines:
                 return None
-            plain_lines = [self._line_text(line) for line in lines]
-            text = "\n".join(plain_lines).rstrip("\n")
+            text = "\n".join(lines).rstrip("\n")
             return text or None
 
         def _cursor_span(self) -> tuple[Offset, Offset]:
@@ -444,14 +559,35 @@ if _BaseLog is not None:
             if self._mouse_dragged:
                 self._cursor_only = False
                 if self._use_custom_selection:
-                    self._set_selection(
-                        self._selection_anchor,
-                        self._selection_cursor,
-                    )
+                    self._schedule_drag_selection()
             handler = getattr(super(), "on_mouse_move", None)
             if handler is not None:
                 handler(event)
 
+        def _schedule_drag_selection(self) -> None:
+            # Publish at most one range per interval; a throttled move
+            # leaves a trailing update so a paused drag shows its cursor.
+            wait = (
+                self._last_move_ts + _SELECTION_MOVE_INTERVAL
+                - time.monotonic()
+            )
+            if wait <= 0:
+                self._apply_drag_selection()
+            elif not self._drag_update_pending:
+                self._drag_update_pending = True
+                self.set_timer(wait, self._apply_drag_selection)
+
+        def _apply_drag_selection(self) -> None:
+            self._drag_update_pending = False
+            if not self._mouse_selecting:
+                return
+            anchor = self._selection_anchor
+            cursor = self._selection_cursor
+            if anchor is None or cursor is None:
+                return
+            self._last_move_ts = time.monotonic()
+            self._set_selection(anchor, cursor)
+
         def on_mouse_up(
             self,
             event: events.MouseUp,
@@ -487,46 +623,13 @@ if _BaseLog is not None:
             self,
             event: events.Key,
         ) -> None:  # pragma: no cover - UI behaviour
-            aliases = set(event.aliases)
-            shift_direction = self._direction_from_aliases(aliases, shift=True)
-            if shift_direction is not None:
-                dx, dy = shift_direction
-                self._move_cursor(dx=dx, dy=dy, extend=True)
-                event.stop()
-                return
-
-            direction = self._direction_from_aliases(aliases, shift=False)
-            if direction is None:
-                return
-            dx, dy = direction
-            self._move_cursor(dx=dx, dy=dy, extend=False)
-            event.stop()
-
-        def _direction_from_aliases(
-            self,
-            aliases: set[str],
-            *,
-            shift: bool,
-        ) -> tuple[int, int] | None:
-            mapping = (
-                [
-                    ("shift+up", (0, -1)),
-                    ("shift+down", (0, 1)),
-                    ("shift+left", (-1, 0)),
-                    ("shift+right", (1, 0)),
-                ]
-                if shift
-                else [
-                    ("up", (0, -1)),
-                    ("down", (0, 1)),
-                    ("left", (-1, 0)),
-                    ("right", (1, 0)),
-                ]
-            )
-            for key, delta in mapping:
-                if key in aliases:
-                    return delta
-            return None
+            for alias in event.aliases:
+                step = _CURSOR_KEY_STEPS.get(alias)
+                if step is not None:
+                    dx, dy, extend = step
+                    self._move_cursor(dx=dx, dy=dy, extend=extend)
+                    event.stop()
+                    return
 
 else:
 
@@ -540,11 +643,12 @@ else:
             classes: str | None = None,
         ) -> None:
             super().__init__("", id=id, classes=classes)
-            self._lines: list[str] = []
+            self._lines: list[Text] = []
 
         def write(self, text: str) -> None:  # type: ignore[override]
-            self._lines.append(text)
-            self.update("\n".join(self._lines))
+            # Parse only the new line; earlier lines keep their parsed Text.
+            self._lines.append(Text.from_markup(text.rstrip("\n")))
+            self.update(Group(*self._lines))
 
         def clear(self) -> None:  # type: ignore[override]
             self._lines.clear()
@@ -596,7 +700,10 @@ class ResultsArea(TextArea):
             pass
 
     def set_log_kind(self, log_kind: str | None) -> None:
-        self._log_kind = log_kind or ""
+        kind = log_kind or ""
+        if kind == self._log_kind:
+            return
+        self._log_kind = kind
         self._build_highlight_map()
         self.refresh()
 
@@ -606,7 +713,11 @@ class ResultsArea(TextArea):
     ) -> None:
         """Set clickable Delivery-log lookup rows for rendered results."""
 
-        self._delivery_lookup_links = {link.row: link for link in links}
+        by_row = {link.row: link for link in links}
+        if by_row == self._delivery_lookup_links:
+            # Live refreshes reset links repeatedly; skip the full rebuild.
+            return
+        self._delivery_lookup_links = by_row
         if self._hover_delivery_lookup_row not in self._delivery_lookup_links:
             self._hover_delivery_lookup_row = None
         if (
@@ -771,17 +882,15 @@ class ResultsArea(TextArea):
         kind = getattr(self, "_log_kind", "")
         for row in range(document.line_count):
             line = document.get_line(row)
-            spans = spans_for_line(kind, line)
-            if not spans:
-                spans = []
+            spans = _cached_spans(kind, line)
             if row in self._delivery_lookup_links:
                 token = TOKEN_LINK
                 if row == self._hover_delivery_lookup_row:
                     token = TOKEN_LINK_HOVER
-                spans.append(HighlightSpan(0, len(line), token))
+                spans = (*spans, HighlightSpan(0, len(line), token))
             if not spans:
                 continue
-            offsets = _byte_offsets(line)
+            offsets = _cached_byte_offsets(line)
             line_highlights = highlights[row]
             for span in spans:
                 start = _clamp_index(span.start, len(line))
@@ -793,12 +902,31 @@ class ResultsArea(TextArea):
                 )
 
 
+@lru_cache(maxsize=8192)
+def _cached_spans(kind: str, line: str) -> tuple[HighlightSpan, ...]:
+    # Result logs repeat many lines verbatim, so reuse their tokenization.
+    return tuple(spans_for_line(kind, line))
+
+
+@lru_cache(maxsize=1024)
+def _cached_byte_offsets(line: str) -> tuple[int, ...]:
+    return tuple(_byte_offsets(line))
+
+
 def _byte_offsets(line: str) -> list[int]:
-    offsets = [0]
-    total = 0
-    for ch in line:
-        total += len(ch.encode("utf-8"))
-        offsets.append(total)
+    if line.isascii():
+        # Most log lines are ASCII; skip encoding them entirely.
+        return list(range(len(line) + 1))
+    data = line.encode("utf-8")
+    size = len(data)
+    # Each code point starts at a byte that is not a 0b10xxxxxx
+    # continuation byte, so one pass over the encoded line is enough.
+    offsets = [
+        index
+        for index, byte in enumerate(data)
+        if byte & 0xC0 != 0x80
+    ]
+    offsets.append(size)
     return offsets
 
 
@@ -900,6 +1028,8 @@ class TopAction(Static):
     """Compact, clickable action label for the persistent top row."""
 
     can_focus = True
+    # Mnemonic style per theme name; cleared by the app on theme change.
+    _STYLE_CACHE: dict[str, str] = {}
 
     def __init__(
         self,
@@ -926,11 +1056,19 @@ class TopAction(Static):
         app = getattr(self, "app", None)
         if app is None:
             return default
+        theme_name = getattr(app, "theme", None)
+        cached = self._STYLE_CACHE.get(theme_name) if theme_name else None
+        if cached is not None:
+            return cached
         variables = getattr(app, "theme_variables", {})
         color = variables.get("top-action-mnemonic-foreground")
         if not isinstance(color, str) or not color:
+            # Variables may not be populated yet, so don't cache this.
             return default
-        return f"bold {color}"
+        style = f"bold {color}"
+        if theme_name:
+            self._STYLE_CACHE[theme_name] = style
+        return style
 
     def _dispatch(self) -> None:
         self.post_message(TopActionPressed(self, self.action))
@@ -970,7 +1108,7 @@ class SearchRequest:
     result_mode: str
     fuzzy_threshold: float
     ignore_case: bool
-    source_paths: list[Path]
+    source_paths: tuple[Path, ...]
     needs_staging: bool
     use_index_cache: bool
 
@@ -982,29 +1120,63 @@ class SearchOutput:
     kind: str
     term: str
     result_mode: str
-    targets: list[Path]
+    targets: Sequence[Path]
     results: list[SmtpSearchResult]
 
 
+class LiveMatchBatch(Message):
+    """Event message carrying matched lines found in one target log.
+
+    ``worker`` is the search worker that found the lines; it identifies the
+    search session so batches from a cancelled search can be dropped.
+    """
+
+    def __init__(
+        self,
+        worker: Worker[SearchOutput],
+        current: int,
+        total: int,
+        target_name: str,
+        batch: list[tuple[int, str]],
+    ) -> None:
+        super().__init__()
+        self.worker = worker
+        self.current = current
+        self.total = total
+        self.target_name = target_name
+        self.batch = batch
+
+
 class _LiveTargetCallbacks:
-    """Buffered callbacks used while scanning a single target log."""
+    """Buffered callbacks used while scanning a single target log.
+
+    Matches are sent to the UI in batches of ``_LIVE_MATCH_BATCH_SIZE``.
+    Smaller batches are drained by the UI repaint timer, so sparse matches
+    from slow scans show up without a clock read per match. At most
+    ``_LIVE_MATCH_MAX_PENDING_BATCHES`` batches wait for the UI at once;
+    further flushes block until the UI catches up.
+    """
 
     def __init__(
         self,
         app: "LogBrowser",
+        worker: Worker[SearchOutput],
         *,
         index: int,
         total: int,
         target_name: str,
     ) -> None:
         self._app = app
+        self._worker = worker
         self._index = index
         self._total = total
         self._target_name = target_name
         self._pending_matches: list[tuple[int, str]] = []
-        self._last_flush = time.perf_counter()
+        # Guards _pending_matches, which the UI thread drains too.
+        self._lock = threading.Lock()
 
     def report_progress(self, scanned_bytes: int, total_bytes: int) -> None:
+        self.flush()
         self._app.call_from_thread(
             self._app._notify_target_search_progress,
             self._index,
@@ -1015,40 +1187,65 @@ class _LiveTargetCallbacks:
         )
 
     def report_match(self, line_number: int, line: str) -> None:
-        self._pending_matches.append((line_number, line))
-        self.flush(force=False)
-
-    def flush(self, *, force: bool) -> None:
+        with self._lock:
+            pending = self._pending_matches
+            pending.append((line_number, line))
+            full = len(pending) >= _LIVE_MATCH_BATCH_SIZE
+        if full:
+            self.flush()
+
+    def flush(self, *, wait: bool = True) -> None:
+        """Post pending matches; without ``wait``, skip if the UI is busy."""
         if not self._pending_matches:
             return
-        now = time.perf_counter()
-        if not force and self._should_defer_flush(now):
-            return
-        batch = self._pending_matches
-        self._pending_matches = []
-        self._last_flush = now
-        self._app.call_from_thread(
-            self._app._on_live_target_match_batch,
-            self._index,
-            self._total,
-            self._target_name,
-            batch,
-        )
-
-    def _should_defer_flush(self, now: float) -> bool:
-        below_batch_size = len(self._pending_matches) < _LIVE_MATCH_BATCH_SIZE
-        too_soon = now - self._last_flush < _LIVE_MATCH_FLUSH_SECONDS
-        return below_batch_size and too_soon
+        slots = self._app._live_batch_slots
+        if not wait:
+            if not slots.acquire(blocking=False):
+                return
+        else:
+            while not slots.acquire(timeout=_SEARCH_CANCEL_POLL_SECONDS):
+                if self._worker.is_cancelled:
+                    return
+        # Take and post under the lock so worker and UI flushes keep order.
+        with self._lock:
+            batch = self._pending_matches
+            self._pending_matches = []
+            # Posting is thread-safe and does not wait for the UI.
+            posted = bool(batch) and self._app.post_message(
+                LiveMatchBatch(
+                    self._worker,
+                    self._index,
+                    self._total,
+                    self._target_name,
+                    batch,
+                )
+            )
+        if not posted:
+            slots.release()
 
 
 MAX_SEARCH_WORKERS = 4
+_PROCESS_CHUNKS_PER_WORKER = 4
+# Fallback poll for cancels that bypass the cancel signal (e.g. app exit).
+_SEARCH_CANCEL_POLL_SECONDS = 1.0
 _LIVE_MATCH_BATCH_SIZE = 64
-_LIVE_MATCH_FLUSH_SECONDS = 0.2
+_LIVE_MATCH_MAX_PENDING_BATCHES = 8
 _LIVE_MATCH_PREVIEW_LINES = 240
 _LIVE_OUTPUT_REFRESH_SECONDS = 0.1
-_BACK_NAVIGATION_GUARD_SECONDS = 0.35
+_BACK_NAVIGATION_GUARD_NS = 350_000_000
+_STAGING_PROGRESS_INTERVAL_NS = 50_000_000
+_PARALLEL_PROGRESS_INTERVAL_NS = 50_000_000
+_FUZZY_THRESHOLD_ACTIONS = frozenset(
+    {"raise_fuzzy_threshold", "lower_fuzzy_threshold"}
+)
+_SEARCH_STEP_ACTIONS = (
+    frozenset({"focus_search", "next_search_mode", "prev_search_mode"})
+    | _FUZZY_THRESHOLD_ACTIONS
+)
 _LIVE_PROGRESS_BAR_WIDTH = 24
 _OSC52_MAX_TEXT_BYTES = 75000
+_SNAPSHOT_WRITE_BUFFER_BYTES = 1024 * 1024
+_PREFETCH_READ_BYTES = 1024 * 1024
 _MOUSE_LEFT_BUTTON = 1
 _MOUSE_RIGHT_BUTTON = 3
 DELIVERY_LOOKUP_LINK_TEXT = "Find this message in the Delivery Log"
@@ -1072,26 +1269,42 @@ class _RenderedResultView:
     delivery_lookup_links: list[_DeliveryLookupLink]
 
 
-def _search_single_target(
+def _search_target_chunk(
     kind: str,
-    target: Path,
     term: str,
     mode: str,
     fuzzy_threshold: float,
     ignore_case: bool,
     use_index_cache: bool,
-) -> SmtpSearchResult:
+    targets: Sequence[Path],
+) -> list[SmtpSearchResult]:
+    # Resolve the handler once per chunk rather than once per target.
     search_fn = get_search_function(kind)
     if search_fn is None:
         raise ValueError(f"No search handler for log kind: {kind}")
-    return search_fn(
-        target,
-        term,
-        mode=mode,
-        fuzzy_threshold=fuzzy_threshold,
-        ignore_case=ignore_case,
-        use_index_cache=use_index_cache,
-    )
+    return [
+        search_fn(
+            target,
+            term,
+            mode=mode,
+            fuzzy_threshold=fuzzy_threshold,
+            ignore_case=ignore_case,
+            use_index_cache=use_index_cache,
+        )
+        for target in targets
+    ]
+
+
+def _target_chunk_bounds(
+    target_count: int,
+    workers: int,
+) -> list[tuple[int, int]]:
+    chunk_count = max(1, workers * _PROCESS_CHUNKS_PER_WORKER)
+    size = max(1, -(-target_count // chunk_count))
+    return [
+        (start, min(start + size, target_count))
+        for start in range(0, target_count, size)
+    ]
 
 
 def _parallel_worker_count(target_count: int) -> int:
@@ -1101,7 +1314,7 @@ def _parallel_worker_count(target_count: int) -> int:
     return max(1, min(target_count, cpu_count, MAX_SEARCH_WORKERS))
 
 
-def _target_workload_bytes(targets: list[Path]) -> int:
+def _target_workload_bytes(targets: Sequence[Path]) -> int:
     total = 0
     for target in targets:
         try:
@@ -1111,6 +1324,27 @@ def _target_workload_bytes(targets: list[Path]) -> int:
     return total
 
 
+def _logs_dir_scan_key(logs_dir: Path) -> tuple[Path, int] | None:
+    try:
+        return logs_dir, logs_dir.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _snapshot_line_blocks(
+    results: Iterable[SmtpSearchResult],
+    result_mode: str,
+) -> Iterator[Sequence[str]]:
+    # Yield lines per conversation or row group, never the whole result set.
+    for result in results:
+        if result_mode == RESULT_MODE_MATCHING_ROWS:
+            yield [line for _line_number, line in result.matching_rows]
+            continue
+        for conversation in result.conversations:
+            yield conversation.lines
+        yield [line for _line_number, line in result.orphan_matches]
+
+
 def _format_size(value: int) -> str:
     units = ["B", "KB", "MB", "GB", "TB"]
     amount = float(max(value, 0))
@@ -1122,6 +1356,8 @@ def _format_size(value: int) -> str:
     return f"{amount:.1f}{unit}"
 
 
+# Only a few hundred distinct bars exist, so each is built once.
+@lru_cache(maxsize=256)
 def _progress_bar(
     percent: int,
     *,
@@ -1184,127 +1420,215 @@ def _shift_delivery_lookup_links(
     ]
 
 
+def _new_search_process_pool(workers: int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+    )
+
+
+def _cancel_pending_searches(
+    executor: Executor,
+    futures: Iterable[Future],
+    *,
+    owns_executor: bool,
+) -> None:
+    if owns_executor:
+        executor.shutdown(wait=False, cancel_futures=True)
+        return
+    # Shared pools outlive the search, so only drop this search's work.
+    for future in futures:
+        future.cancel()
+
+
+def _cancel_check(
+    is_cancelled: Callable[[], bool] | None,
+    cancel_signal: Future | None,
+) -> Callable[[], bool]:
+    def cancelled() -> bool:
+        if cancel_signal is not None and cancel_signal.done():
+            return True
+        return is_cancelled is not None and is_cancelled()
+
+    return cancelled
+
+
+def _awaitable_futures(
+    futures: Iterable[Future],
+    cancel_signal: Future | None,
+) -> list[Future]:
+    # Waiting on the signal too wakes the loop as soon as a cancel lands.
+    waiting = list(futures)
+    if cancel_signal is not None:
+        waiting.append(cancel_signal)
+    return waiting
+
+
 def _search_targets_in_process_pool(
     request: SearchRequest,
-    targets: list[Path],
+    targets: Sequence[Path],
     *,
     workers: int,
+    executor: ProcessPoolExecutor | None = None,
+    cancel_signal: Future | None = None,
     is_cancelled: Callable[[], bool] | None = None,
     on_result: Callable[[int, Path, SmtpSearchResult], None] | None = None,
     on_completed: Callable[[int, int, Path], None] | None = None,
 ) -> list[SmtpSearchResult]:
-    executor = ProcessPoolExecutor(
-        max_workers=workers,
-        mp_context=mp.get_context("spawn"),
+    owns_executor = executor is None
+    if executor is None:
+        executor = _new_search_process_pool(workers)
+    # Contiguous chunks cut per-target IPC and pickling round trips.
+    return _drive_search_executor(
+        executor,
+        request,
+        targets,
+        _target_chunk_bounds(len(targets), workers),
+        max_in_flight=workers * 2,
+        owns_executor=owns_executor,
+        cancel_signal=cancel_signal,
+        is_cancelled=is_cancelled,
+        on_result=on_result,
+        on_completed=on_completed,
     )
-    future_to_index = {}
-    results: list[SmtpSearchResult | None] = [None] * len(targets)
-    completed = 0
-    try:
-        for index, target in enumerate(targets):
-            if is_cancelled is not None and is_cancelled():
-                executor.shutdown(wait=False, cancel_futures=True)
-                raise WorkerCancelled()
-            future = executor.submit(
-                _search_single_target,
-                request.kind,
-                target,
-                request.term,
-                request.mode,
-                request.fuzzy_threshold,
-                request.ignore_case,
-                request.use_index_cache,
-            )
-            future_to_index[future] = index
-
-        while future_to_index:
-            if is_cancelled is not None and is_cancelled():
-                executor.shutdown(wait=False, cancel_futures=True)
-                raise WorkerCancelled()
-            done, _pending = wait(
-                set(future_to_index),
-                timeout=0.2,
-                return_when=FIRST_COMPLETED,
-            )
-            if not done:
-                continue
-            for future in done:
-                index = future_to_index.pop(future)
-                result = future.result()
-                results[index] = result
-                if on_result is not None:
-                    on_result(index, targets[index], result)
-                completed += 1
-                if on_completed is not None:
-                    on_completed(completed, len(targets), targets[index])
-    finally:
-        executor.shutdown(cancel_futures=True)
-    return [result for result in results if result is not None]
 
 
 def _search_targets_in_thread_pool(
     request: SearchRequest,
-    targets: list[Path],
+    targets: Sequence[Path],
     *,
     workers: int,
+    executor: ThreadPoolExecutor | None = None,
+    cancel_signal: Future | None = None,
     is_cancelled: Callable[[], bool] | None = None,
     on_result: Callable[[int, Path, SmtpSearchResult], None] | None = None,
     on_completed: Callable[[int, int, Path], None] | None = None,
 ) -> list[SmtpSearchResult]:
-    executor = ThreadPoolExecutor(max_workers=workers)
-    future_to_index = {}
+    owns_executor = executor is None
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    # Threads share memory, so one target per task streams results best.
+    return _drive_search_executor(
+        executor,
+        request,
+        targets,
+        [(index, index + 1) for index in range(len(targets))],
+        max_in_flight=workers * 2,
+        owns_executor=owns_executor,
+        cancel_signal=cancel_signal,
+        is_cancelled=is_cancelled,
+        on_result=on_result,
+        on_completed=on_completed,
+    )
+
+
+def _drive_search_executor(
+    executor: Executor,
+    request: SearchRequest,
+    targets: Sequence[Path],
+    bounds: list[tuple[int, int]],
+    *,
+    max_in_flight: int,
+    owns_executor: bool,
+    cancel_signal: Future | None,
+    is_cancelled: Callable[[], bool] | None,
+    on_result: Callable[[int, Path, SmtpSearchResult], None] | None,
+    on_completed: Callable[[int, int, Path], None] | None,
+) -> list[SmtpSearchResult]:
+    cancel_requested = _cancel_check(is_cancelled, cancel_signal)
+    future_to_index: dict[Future, int] = {}
     results: list[SmtpSearchResult | None] = [None] * len(targets)
     completed = 0
+    cancelled = False
+    pending_bounds = iter(bounds)
+    # Bind the request fields once; each submit then only carries its
+    # slice of targets.
+    search_chunk = partial(
+        _search_target_chunk,
+        request.kind,
+        request.term,
+        request.mode,
+        request.fuzzy_threshold,
+        request.ignore_case,
+        request.use_index_cache,
+    )
+
+    def submit_next() -> bool:
+        bound = next(pending_bounds, None)
+        if bound is None:
+            return False
+        start, stop = bound
+        future = executor.submit(search_chunk, targets[start:stop])
+        future_to_index[future] = start
+        return True
+
     try:
-        for index, target in enumerate(targets):
-            if is_cancelled is not None and is_cancelled():
-                executor.shutdown(wait=False, cancel_futures=True)
-                raise WorkerCancelled()
-            future = executor.submit(
-                _search_single_target,
-                request.kind,
-                target,
-                request.term,
-                request.mode,
-                request.fuzzy_threshold,
-                request.ignore_case,
-                request.use_index_cache,
-            )
-            future_to_index[future] = index
+        # Keep only a bounded window of tasks queued; each completion
+        # submits the next one, so the future table never grows with N.
+        for _ in range(max(1, max_in_flight)):
+            if not submit_next():
+                break
 
         while future_to_index:
-            if is_cancelled is not None and is_cancelled():
-                executor.shutdown(wait=False, cancel_futures=True)
+            if cancel_requested():
+                cancelled = True
+                _cancel_pending_searches(
+                    executor,
+                    future_to_index,
+                    owns_executor=owns_executor,
+                )
                 raise WorkerCancelled()
-            done, _pending = wait(
-                set(future_to_index),
-                timeout=0.2,
-                return_when=FIRST_COMPLETED,
-            )
-            if not done:
+            # Handle one task per pass so its replacement joins the wait;
+            # the timeout only catches cancels without the cancel signal.
+            try:
+                future = next(
+                    as_completed(
+                        _awaitable_futures(future_to_index, cancel_signal),
+                        timeout=_SEARCH_CANCEL_POLL_SECONDS,
+                    )
+                )
+            except FutureTimeoutError:
                 continue
-            for future in done:
-                index = future_to_index.pop(future)
-                result = future.result()
+            if future is cancel_signal:
+                continue
+            start = future_to_index.pop(future)
+            chunk = future.result()
+            submit_next()
+            for index, result in enumerate(chunk, start):
                 results[index] = result
                 if on_result is not None:
                     on_result(index, targets[index], result)
-                completed += 1
-                if on_completed is not None:
-                    on_completed(completed, len(targets), targets[index])
+            completed += len(chunk)
+            # One progress call per finished task, not per target, so
+            # callers can batch their UI updates on it.
+            if on_completed is not None and chunk:
+                on_completed(
+                    completed,
+                    len(targets),
+                    targets[start + len(chunk) - 1],
+                )
     finally:
-        executor.shutdown(cancel_futures=True)
-    return [result for result in results if result is not None]
+        if owns_executor:
+            # After a cancel the pool is already shutting down; joining
+            # its running tasks here would only delay the cancel.
+            executor.shutdown(wait=not cancelled, cancel_futures=True)
+        else:
+            for future in future_to_index:
+                future.cancel()
+    # Cancellation raises above, so reaching here means every slot is set.
+    return cast(list[SmtpSearchResult], results)
 
 
 class KindListItem(ListItem):
     """Selectable list item representing a log kind."""
 
     def __init__(self, kind: str) -> None:
-        self.label_widget = Static(kind, classes="label")
-        super().__init__(self.label_widget)
+        super().__init__()
         self.kind = kind
 
+    def compose(self) -> ComposeResult:
+        yield Static(self.kind, classes="label")
+
     def set_selected(self, selected: bool) -> None:
         if selected:
             self.add_class("selected")
@@ -1328,6 +1652,13 @@ class KindListView(ListView):
                 child.set_active(child.kind == kind)
 
 
+@lru_cache(maxsize=1024)
+def _date_item_label(stamp: date, is_zipped: bool) -> str:
+    # Formatting the fields directly is much cheaper than strftime.
+    label = f"{stamp.year:04d}.{stamp.month:02d}.{stamp.day:02d}"
+    return f"{label} (zip)" if is_zipped else label
+
+
 class DateListItem(ListItem):
     """Selectable list item representing a single dated log file."""
 
@@ -1335,17 +1666,21 @@ class DateListItem(ListItem):
         self,
         info: LogFileInfo,
     ) -> None:
-        label = (
-            info.stamp.strftime("%Y.%m.%d")
-            if info.stamp
-            else info.path.name
-        )
-        suffix = " (zip)" if info.is_zipped else ""
-        self.label_widget = Static(f"{label}{suffix}", classes="label")
-        super().__init__(self.label_widget)
+        if info.stamp:
+            label = _date_item_label(info.stamp, info.is_zipped)
+        elif info.is_zipped:
+            label = f"{info.path.name} (zip)"
+        else:
+            label = info.path.name
+        super().__init__()
+        self.label_text = label
         self.info = info
         self.selected = False
 
+    def compose(self) -> ComposeResult:
+        # Build the label widget only when the row is mounted.
+        yield Static(self.label_text, classes="label")
+
     def set_selected(self, selected: bool) -> None:
         self.selected = selected
         if selected:
@@ -1473,6 +1808,8 @@ class MnemonicFooterKey(FooterKey):
     ) -> None:
         super().__init__(*args, **kwargs)
         self._mnemonic_index = mnemonic_index
+        self._render_key: tuple[object, ...] | None = None
+        self._render_text: Text | None = None
 
     def render(self) -> Text:
         key_style = self.get_component_rich_style("footer-key--key")
@@ -1484,17 +1821,32 @@ class MnemonicFooterKey(FooterKey):
         description_padding = self.get_component_styles(
             "footer-key--description"
         ).padding
-
         description = self.description
+        rich_style = self.rich_style
+
+        # Styles only change on hover, focus or theme switches, so repeat
+        # paints can reuse the last assembled label.
+        render_key = (
+            key_display,
+            description,
+            key_style,
+            description_style,
+            key_padding,
+            description_padding,
+            rich_style,
+        )
+        if render_key == self._render_key and self._render_text is not None:
+            return self._render_text.copy()
+
         if description:
             key_text = Text(
-                " " * key_padding.left + key_display + " " * key_padding.right,
+                f"{'':{key_padding.left}}{key_display}"
+                f"{'':{key_padding.right}}",
                 style=key_style,
             )
             desc_text = Text(
-                " " * description_padding.left
-                + description
-                + " " * description_padding.right,
+                f"{'':{description_padding.left}}{description}"
+                f"{'':{description_padding.right}}",
                 style=description_style,
             )
             if self._mnemonic_index is not None:
@@ -1509,25 +1861,31 @@ class MnemonicFooterKey(FooterKey):
         else:
             label_text = Text.assemble((key_display, key_style))
 
-        label_text.stylize_before(self.rich_style)
-        return label_text
+        label_text.stylize_before(rich_style)
+        self._render_key = render_key
+        self._render_text = label_text
+        return label_text.copy()
+
+
+@lru_cache(maxsize=128)
+def _mnemonic_index(key: str, description: str) -> int | None:
+    if not description:
+        return None
+    letters = [char for char in key if char.isalpha()]
+    if not letters:
+        return None
+    target = letters[-1].lower()
+    for idx, char in enumerate(description):
+        if char.lower() == target:
+            return idx
+    return None
 
 
 class MenuFooter(Footer):
     """Footer variant with mnemonic-aware key labels."""
 
     def _mnemonic_index(self, binding: Binding) -> int | None:
-        description = binding.description
-        if not description:
-            return None
-        letters = [char for char in binding.key if char.isalpha()]
-        if not letters:
-            return None
-        target = letters[-1]
-        for idx, char in enumerate(description):
-            if char.lower() == target.lower():
-                return idx
-        return None
+        return _mnemonic_index(binding.key, binding.description)
 
     def _build_footer_key(
         self,
@@ -1601,13 +1959,51 @@ class MenuFooter(Footer):
                     yield self._build_footer_key(binding, enabled, tooltip)
 
 
+def _mask_indices(mask: int) -> Iterator[int]:
+    # Walk set bits lowest first, so cost follows the selection size.
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+_DATE_LIST_NAV_ACTIONS = {
+    "down": "action_cursor_down",
+    "shift+down": "action_cursor_down",
+    "up": "action_cursor_up",
+    "shift+up": "action_cursor_up",
+    "pageup": "action_cursor_page_up",
+    "shift+pageup": "action_cursor_page_up",
+    "pagedown": "action_cursor_page_down",
+    "shift+pagedown": "action_cursor_page_down",
+    "home": "action_cursor_home",
+    "shift+home": "action_cursor_home",
+    "end": "action_cursor_end",
+    "shift+end": "action_cursor_end",
+}
+
+
 class DateListView(ListView):
     """List view that supports persistent multi-selection via toggles."""
 
+    # Resolved once; keys whose cursor action ListView lacks are left to
+    # the default key handling.
+    _NAV_ACTIONS: ClassVar[dict[str, Callable[[ListView], object]]] = {
+        key: getattr(ListView, name)
+        for key, name in _DATE_LIST_NAV_ACTIONS.items()
+        if hasattr(ListView, name)
+    }
+
     def __init__(self) -> None:
         super().__init__(id="date-list")
-        self.selected_indices: set[int] = set()
         self.anchor_index: Optional[int] = None
+        self._infos: list[LogFileInfo] = []
+        # Bit ``i`` is set when row ``i`` is selected.
+        self._selected_mask = 0
+        self._prev_mask = 0
+        self._prev_active = -1
+        self._posted_mask = 0
+        self._index_by_item: dict[DateListItem, int] = {}
 
     # Keyboard handling --------------------------------------------------
     def on_key(
@@ -1637,10 +2033,10 @@ class DateListView(ListView):
         self._update_visual_state()
 
     def _apply_enter(self, index: int) -> None:
-        if index not in self.selected_indices:
+        if not self._selected_mask >> index & 1:
             # Enter should make the highlighted date usable as the common
             # single-day path, while Space/click remain available for toggles.
-            self.selected_indices = {index}
+            self._selected_mask = 1 << index
             self.anchor_index = index
             self._update_visual_state()
 
@@ -1648,29 +2044,11 @@ class DateListView(ListView):
         self._trigger_search_transition()
 
     def _handle_navigation_key(self, key: str, fallback_index: int) -> bool:
-        action_names = {
-            "down": "action_cursor_down",
-            "shift+down": "action_cursor_down",
-            "up": "action_cursor_up",
-            "shift+up": "action_cursor_up",
-            "pageup": "action_cursor_page_up",
-            "shift+pageup": "action_cursor_page_up",
-            "pagedown": "action_cursor_page_down",
-            "shift+pagedown": "action_cursor_page_down",
-            "home": "action_cursor_home",
-            "shift+home": "action_cursor_home",
-            "end": "action_cursor_end",
-            "shift+end": "action_cursor_end",
-        }
-        action_name = action_names.get(key)
-        if action_name is None:
-            return False
-
-        action = getattr(self, action_name, None)
+        action = self._NAV_ACTIONS.get(key)
         if action is None:
             return False
 
-        action()
+        action(self)
         new_index = self.index if self.index is not None else fallback_index
         self.anchor_index = new_index
         self._update_visual_state()
@@ -1678,6 +2056,10 @@ class DateListView(ListView):
         return True
 
     def _post_selection(self) -> None:
+        # Cursor moves do not change the selection; only post real changes.
+        if self._selected_mask == self._posted_mask:
+            return
+        self._posted_mask = self._selected_mask
         self.post_message(DateSelectionChanged(self, self.selected_infos))
 
     def _trigger_search_transition(self) -> None:
@@ -1703,10 +2085,8 @@ class DateListView(ListView):
         item: DateListItem,
         event: events.MouseDown,
     ) -> None:
-        children = list(self.children)
-        try:
-            index = children.index(item)
-        except ValueError:  # pragma: no cover - defensive
+        index = self._index_by_item.get(item)
+        if index is None:  # pragma: no cover - defensive
             return
 
         self._toggle_current(index)
@@ -1719,42 +2099,61 @@ class DateListView(ListView):
         infos: list[LogFileInfo],
         default_indices: Iterable[int],
     ) -> None:
-        for child in list(self.children):
-            child.remove()
-        for info in infos:
-            self.append(DateListItem(info))
-        self.selected_indices = set(default_indices)
-        if self.selected_indices:
-            first = min(self.selected_indices)
+        self.remove_children()
+        self._infos = list(infos)
+        self._prev_mask = 0
+        self._prev_active = -1
+        items = [DateListItem(info) for info in self._infos]
+        self._index_by_item = {item: idx for idx, item in enumerate(items)}
+        # Mount all rows in one batch rather than one mount per row.
+        self.extend(items)
+        mask = 0
+        for index in default_indices:
+            mask |= 1 << index
+        self._selected_mask = mask
+        # The app seeds its selection from the same defaults.
+        self._posted_mask = mask
+        if mask:
+            first = (mask & -mask).bit_length() - 1
             self.index = first
             self.anchor_index = first
         self._update_visual_state()
 
     def _toggle_index(self, index: int) -> None:
-        if index in self.selected_indices:
-            self.selected_indices.remove(index)
-        else:
-            self.selected_indices.add(index)
+        self._selected_mask ^= 1 << index
 
     def _update_visual_state(self) -> None:
         current_index = self.index if self.index is not None else -1
-        for idx, child in enumerate(self.children):
+        mask = self._selected_mask
+        changed = set(_mask_indices(mask ^ self._prev_mask))
+        changed.update((self._prev_active, current_index))
+        children = self.children
+        for idx in changed:
+            if not 0 <= idx < len(children):
+                continue
+            child = children[idx]
             if isinstance(child, DateListItem):
-                child.set_selected(idx in self.selected_indices)
+                child.set_selected(bool(mask >> idx & 1))
                 child.set_active(idx == current_index)
+        self._prev_mask = mask
+        self._prev_active = current_index
 
     @property
     def selected_infos(self) -> list[LogFileInfo]:
         """Return currently selected log file infos in list order."""
 
-        infos: list[LogFileInfo] = []
-        for idx, child in enumerate(self.children):
-            if not isinstance(child, DateListItem):
-                continue
-            if idx not in self.selected_indices:
-                continue
-            infos.append(child.info)
-        return infos
+        count = len(self._infos)
+        return [
+            self._infos[idx]
+            for idx in _mask_indices(self._selected_mask)
+            if idx < count
+        ]
+
+    @property
+    def selected_indices(self) -> set[int]:
+        """Return the selected row indices."""
+
+        return set(_mask_indices(self._selected_mask))
 
 
 class LogBrowser(App):
@@ -1963,9 +2362,29 @@ class LogBrowser(App):
     }
     """
 
-    logs_dir: reactive[Path] = reactive(Path.cwd())
-    staging_dir: reactive[Optional[Path]] = reactive(None)
-    default_kind: reactive[Optional[str]] = reactive(KIND_SMTP)
+    # Button id -> handler method name, looked up once per press.
+    _BUTTON_HANDLERS: ClassVar[dict[str, str]] = {
+        "quit-kind": "exit",
+        "next-kind": "_next_from_kind",
+        "back-date": "_show_step_kind",
+        "next-date": "_next_from_date",
+        "back-search": "_show_step_date",
+        "back-results": "_back_to_results",
+        "cycle-search-mode": "_cycle_search_mode",
+        "cycle-result-mode": "_cycle_result_mode",
+        "do-search": "_perform_search",
+        "cancel-search": "_cancel_search",
+        "new-search": "_start_new_search",
+        "sub-search": "_start_subsearch",
+        "back-subsearch": "_back_from_subsearch",
+        "quit-results": "exit",
+        "copy-selection": "_copy_selection",
+        "copy-all": "_copy_all",
+    }
+    _BUTTONS_ALLOWED_DURING_SEARCH = frozenset(
+        {"cancel-search", "quit-results"}
+    )
+
     _search_mode_cycle = (
         MODE_LITERAL,
         MODE_WILDCARD,
@@ -2004,19 +2423,50 @@ class LogBrowser(App):
             theme_quantize_ansi256=theme_quantize_ansi256,
             theme_overrides=theme_overrides or {},
         )
-        self.logs_dir = logs_dir
-        self.staging_dir = staging_dir
-        self.default_kind = normalize_kind(default_kind or KIND_SMTP)
+        # Plain attributes: nothing watches these, so reactive descriptors
+        # would only add refresh bookkeeping on every assignment.
+        self.logs_dir: Path = logs_dir
+        self.staging_dir: Optional[Path] = staging_dir
+        self.default_kind: Optional[str] = normalize_kind(
+            default_kind or KIND_SMTP
+        )
         self.config_path = config_path.expanduser() if config_path else None
         self.configured_theme = theme
         self._persist_theme_changes_enabled = persist_theme_changes
         self._persist_theme_changes = False
         self._suppress_theme_persist = False
         self._logs_by_kind: Dict[str, List[LogFileInfo]] = {}
+        # Set until the first background log scan has been applied.
+        self._log_scan_pending = False
+        self._logs_scan_key: tuple[Path, int] | None = None
         self.current_kind: Optional[str] = None
         self.selected_logs: list[LogFileInfo] = []
         self.step: WizardStep = WizardStep.KIND
         self.kind_list: KindListView | None = None
+        self._step_containers: dict[WizardStep, Vertical] = {}
+        self._next_kind_button: Button | None = None
+        self._kind_index_map: dict[str, int] = {}
+        # Step -> (item type, highlight handler, select handler).
+        self._list_handlers: dict[
+            WizardStep,
+            tuple[
+                type[ListItem],
+                Callable[..., None] | None,
+                Callable[..., None] | None,
+            ],
+        ] = {
+            WizardStep.KIND: (
+                KindListItem,
+                self._highlight_kind_item,
+                self._select_kind_item,
+            ),
+            WizardStep.DATE: (DateListItem, self._highlight_date_item, None),
+        }
+        self._footer_refresh_pending = False
+        self._results_title_label: Static | None = None
+        self._results_button_row: Horizontal | None = None
+        self._results_left_group: Horizontal | None = None
+        self._next_date_button: Button | None = None
         self.date_list: DateListView | None = None
         self.search_input: Input | None = None
         self.search_mode = MODE_LITERAL
@@ -2036,6 +2486,8 @@ class LogBrowser(App):
         self.subsearch_kind: str | None = None
         self.subsearch_depth = 0
         self.last_rendered_lines: list[str] | None = None
+        # Joined copy of last_rendered_lines, keyed by that list's identity.
+        self._full_results_text: tuple[list[str], str] | None = None
         self.last_rendered_kind: str | None = None
         self.last_delivery_lookup_links: list[_DeliveryLookupLink] = []
         self.subsearch_terms: list[str] = []
@@ -2045,12 +2497,20 @@ class LogBrowser(App):
         self.subsearch_delivery_lookup_links: list[
             list[_DeliveryLookupLink]
         ] = []
-        self._result_log_counter = 0
         self._context_menu_open = False
         self._search_worker: Worker[SearchOutput] | None = None
+        self._search_pool: ProcessPoolExecutor | None = None
+        self._search_pool_workers = 0
+        self._thread_pools: dict[int, ThreadPoolExecutor] = {}
+        # Pools are created on search workers but shut down on unmount.
+        self._pool_lock = threading.RLock()
+        # Completed by _cancel_search to wake pool waits immediately.
+        self._search_cancel_signal: Future | None = None
         self._index_worker: Worker[None] | None = None
         self._search_in_progress = False
         self._live_rendered_lines: list[str] = []
+        # Pre-joined copy of _live_rendered_lines for live refreshes.
+        self._live_rendered_text = ""
         self._live_pending_results: dict[
             int,
             tuple[Path, SmtpSearchResult],
@@ -2064,13 +2524,26 @@ class LogBrowser(App):
         self._live_execution_label: str | None = None
         self._last_execution_label: str | None = None
         self._live_match_total = 0
-        self._live_match_preview_lines: list[str] = []
+        # Raw (target, line number, line) matches, formatted on refresh.
+        self._live_match_preview_lines: deque[tuple[str, int, str]] = deque(
+            maxlen=_LIVE_MATCH_PREVIEW_LINES
+        )
         self._live_delivery_lookup_links: list[_DeliveryLookupLink] = []
         self._last_live_output_refresh_at = 0.0
+        # Throttled refreshes mark the output dirty for the repaint tick.
+        self._live_output_dirty = False
+        self._live_output_timer: Timer | None = None
+        # Callbacks of the target being scanned, drained on each repaint.
+        self._live_match_source: _LiveTargetCallbacks | None = None
+        # Released by on_live_match_batch; bounds batches queued for the UI.
+        self._live_batch_slots = threading.Semaphore(
+            _LIVE_MATCH_MAX_PENDING_BATCHES
+        )
+        self._last_target_progress: tuple[int, str, int] | None = None
         self._search_started_at = 0.0
         self._first_result_notified = False
         self._search_session_id = 0
-        self._back_navigation_armed_at = 0.0
+        self._back_navigation_armed_at_ns = 0
         self._last_output_target: object | None = None
         self._last_output_text: str | None = None
         self.theme = CYBERDARK_THEME.name
@@ -2103,13 +2576,19 @@ class LogBrowser(App):
                 "Some imported theme files could not be loaded. "
                 "Check --config theme_import_paths values."
             )
-        self._refresh_logs()
+        self._log_scan_pending = True
         self._show_step_kind()
+        self._start_log_scan()
         self._apply_configured_theme()
         self._persist_theme_changes = self._persist_theme_changes_enabled
 
+    def on_unmount(self) -> None:
+        self._shutdown_search_pool()
+        self._shutdown_thread_pools()
+
     def _watch_theme(self, theme_name: str) -> None:
         super()._watch_theme(theme_name)
+        TopAction._STYLE_CACHE.clear()
         self._sync_results_theme()
         if not self._persist_theme_changes:
             return
@@ -2163,85 +2642,118 @@ class LogBrowser(App):
     # Step rendering -----------------------------------------------------
     def _show_step_kind(self) -> None:
         self.step = WizardStep.KIND
-        self._clear_wizard()
-        self._reset_subsearch()
-        self.wizard.mount(
-            Static("Step 1: Choose a log type", classes="instruction")
+        self._cancel_log_prefetch()
+        with self.batch_update():
+            self._clear_wizard()
+            self._reset_subsearch()
+            self.kind_list, preferred = self._build_kind_list()
+            self.current_kind = preferred
+            self._show_step_container(
+                WizardStep.KIND,
+                self._build_kind_step,
+                self.kind_list,
+            )
+            self._activate_kind_list(preferred)
+
+    def _replace_kind_list(self) -> None:
+        """Swap in a kind list for fresh scan results, keeping the step."""
+
+        stale = self.kind_list
+        container = self._step_containers[WizardStep.KIND]
+        with self.batch_update():
+            self.kind_list, preferred = self._build_kind_list(
+                keep=self.current_kind,
+            )
+            self.current_kind = preferred
+            container.mount(self.kind_list, before=container.children[-1])
+            if stale is not None:
+                stale.remove()
+            self._activate_kind_list(preferred)
+
+    def _activate_kind_list(self, preferred: str | None) -> None:
+        assert self.kind_list is not None
+        if preferred:
+            self.call_after_refresh(
+                lambda: self._apply_kind_selection(preferred)
+            )
+        else:
+            self.kind_list.focus()
+        self._update_next_button_state()
+        self._refresh_footer_bindings()
+
+    def _build_kind_list(
+        self,
+        keep: str | None = None,
+    ) -> tuple[KindListView, str | None]:
+        if not self._logs_by_kind:
+            self._kind_index_map = {}
+            placeholder = (
+                "Scanning logs..."
+                if self._log_scan_pending
+                else "No logs discovered"
+            )
+            kind_list = KindListView(ListItem(Static(placeholder)))
+            kind_list.add_class("selection-list")
+            return kind_list, None
+        kinds_sorted = sorted(self._logs_by_kind)
+        self._kind_index_map = {
+            kind: idx for idx, kind in enumerate(kinds_sorted)
+        }
+        if keep in self._kind_index_map:
+            preferred = keep
+        else:
+            preferred = self._initial_kind_choice(kinds_sorted)
+        items = [KindListItem(kind) for kind in kinds_sorted]
+        kind_list = KindListView(
+            *items,
+            initial_index=self._kind_index_map.get(preferred or "", 0),
         )
+        kind_list.add_class("selection-list")
+        return kind_list, preferred
+
+    def _build_kind_step(self) -> tuple[list[Widget], Widget]:
         next_button = Button(
             "Next",
             id="next-kind",
             classes="action-button",
         )
+        self._next_kind_button = next_button
         quit_button = Button(
             "Quit",
             id="quit-kind",
             classes="action-button",
         )
         self._set_uniform_button_group_widths([next_button, quit_button])
-        button_row = Horizontal(
-            next_button,
-            quit_button,
-            classes="button-row",
+        return (
+            [Static("Step 1: Choose a log type", classes="instruction")],
+            Horizontal(next_button, quit_button, classes="button-row"),
         )
 
-        if not self._logs_by_kind:
-            self.kind_list = KindListView(
-                ListItem(Static("No logs discovered"))
-            )
-            self.kind_list.add_class("selection-list")
-            self.current_kind = None
-            self.wizard.mount(self.kind_list)
-            self.kind_list.focus()
-        else:
-            kinds_sorted = sorted(self._logs_by_kind)
-            preferred = self._initial_kind_choice(kinds_sorted)
-            items: list[ListItem] = []
-            preferred_index = 0
-            for idx, kind in enumerate(kinds_sorted):
-                item = KindListItem(kind)
-                items.append(item)
-                if kind == preferred:
-                    preferred_index = idx
-            initial_index = preferred_index + 1 if preferred is not None else 0
-            self.kind_list = KindListView(
-                *items,
-                initial_index=initial_index,
-            )
-            self.kind_list.add_class("selection-list")
-            self.current_kind = preferred
-            self.wizard.mount(self.kind_list)
-            if preferred:
-                self.call_after_refresh(
-                    lambda: self._apply_kind_selection(preferred)
-                )
-            else:
-                self.kind_list.focus()
-
-        self.wizard.mount(button_row)
-        self._update_next_button_state()
-        self._refresh_footer_bindings()
-
     def _show_step_date(self) -> None:
         self.step = WizardStep.DATE
-        self._clear_wizard()
-        self.wizard.mount(
-            Static(
-                self._date_step_heading_text(),
-                classes="instruction",
+        self._cancel_log_prefetch()
+        with self.batch_update():
+            self._clear_wizard()
+            self.date_list = DateListView()
+            self.date_list.add_class("selection-list")
+            self._show_step_container(
+                WizardStep.DATE,
+                self._build_date_step,
+                self.date_list,
             )
-        )
-        instructions = Static(
-            "Use arrow keys or the mouse to highlight a date. Press Space or "
-            "click to toggle it.\nPress Enter (or Next) when you are ready "
-            "to continue."
-        )
-        self.wizard.mount(instructions)
 
-        self.date_list = DateListView()
-        self.date_list.add_class("selection-list")
-        self.wizard.mount(self.date_list)
+            infos = self._logs_by_kind.get(self.current_kind or "", [])
+            default_indices = self._default_date_indices(infos)
+            if infos:
+                self.selected_logs = [infos[i] for i in default_indices]
+            else:
+                self.selected_logs = []
+            self.date_list.populate(infos, default_indices)
+            self._update_next_button_state()
+            self.date_list.focus()
+            self._refresh_footer_bindings()
 
+    def _build_date_step(self) -> tuple[list[Widget], Widget]:
         back_button = Button(
             "Back",
             id="back-date",
@@ -2252,24 +2764,42 @@ class LogBrowser(App):
             id="next-date",
             classes="action-button",
         )
+        self._next_date_button = next_button
         self._set_uniform_button_group_widths([back_button, next_button])
-        button_row = Horizontal(
-            back_button,
-            next_button,
-            classes="button-row",
+        return (
+            [
+                Static(self._date_step_heading_text(), classes="instruction"),
+                Static(
+                    "Use arrow keys or the mouse to highlight a date. Press "
+                    "Space or click to toggle it.\nPress Enter (or Next) "
+                    "when you are ready to continue."
+                ),
+            ],
+            Horizontal(back_button, next_button, classes="button-row"),
         )
-        self.wizard.mount(button_row)
 
-        infos = self._logs_by_kind.get(self.current_kind or "", [])
-        default_indices = self._default_date_indices(infos)
-        if infos:
-            self.selected_logs = [infos[i] for i in default_indices]
+    def _show_step_container(
+        self,
+        step: WizardStep,
+        build: Callable[[], tuple[list[Widget], Widget]],
+        body: Widget,
+    ) -> None:
+        """Show the cached container for ``step`` with a fresh ``body``."""
+
+        # Headings and button rows never change, so keep them mounted and
+        # only swap the data-dependent body and which step is displayed.
+        container = self._step_containers.get(step)
+        if container is None:
+            header, button_row = build()
+            container = Vertical(classes="wizard-step")
+            self._step_containers[step] = container
+            # Mount through the attached container so ``body`` can be
+            # populated straight away.
+            self.wizard.mount(container)
+            container.mount(*header, body, button_row)
         else:
-            self.selected_logs = []
-        self.date_list.populate(infos, default_indices)
-        self._update_next_button_state()
-        self.date_list.focus()
-        self._refresh_footer_bindings()
+            container.mount(body, before=container.children[-1])
+        container.display = True
 
     def _date_step_heading_text(self) -> Text:
         """Return the Step 2 heading with a preferred wrap before the note."""
@@ -2282,31 +2812,89 @@ class LogBrowser(App):
 
     def _show_step_search(self) -> None:
         self.step = WizardStep.SEARCH
-        self._clear_wizard()
-        self.wizard.mount(
-            Static(self._search_summary_text(), classes="instruction")
+        with self.batch_update():
+            self._clear_wizard()
+            left_buttons, right_buttons = self._build_search_buttons()
+            self.wizard.mount_all(
+                [
+                    Static(
+                        self._search_summary_text(),
+                        classes="instruction",
+                    ),
+                    *self._build_search_controls(),
+                    self._build_search_button_row(
+                        left_buttons,
+                        right_buttons,
+                    ),
+                ]
+            )
+            self._set_search_running(False)
+            if self.search_input is not None:
+                self.search_input.focus()
+            self._refresh_footer_bindings()
+        if not self.subsearch_active and self.selected_logs:
+            self._start_log_prefetch(
+                [info.path for info in self.selected_logs]
+            )
+
+    def _start_log_prefetch(self, paths: list[Path]) -> None:
+        # Read the selected logs while the search term is typed so the
+        # staging copy that follows is served from the page cache.
+        self.run_worker(
+            partial(self._run_log_prefetch_job, paths),
+            name="log-prefetch-worker",
+            group="log-prefetch",
+            thread=True,
+            exclusive=True,
+            exit_on_error=False,
         )
-        self._mount_search_controls()
-        left_buttons, right_buttons = self._build_search_buttons()
-        self._mount_search_button_row(left_buttons, right_buttons)
-        self._set_search_running(False)
-        if self.search_input is not None:
-            self.search_input.focus()
-        self._refresh_footer_bindings()
+
+    def _run_log_prefetch_job(self, paths: list[Path]) -> None:
+        worker = get_current_worker()
+        for path in paths:
+            try:
+                with path.open("rb") as handle:
+                    while handle.read(_PREFETCH_READ_BYTES):
+                        if worker.is_cancelled:
+                            return
+            except OSError:
+                continue
+
+    def _cancel_log_prefetch(self) -> None:
+        self.workers.cancel_group(self, "log-prefetch")
 
     def _show_step_results(self) -> None:
         self.step = WizardStep.RESULTS
-        self._clear_wizard()
-        self._arm_back_navigation()
-        self._mount_results_header()
-        self.output_log = self._build_results_output_log()
-        self._last_output_target = None
-        self._last_output_text = None
-        left_buttons = self._build_results_left_buttons()
-        right_buttons = self._build_results_right_buttons()
-        self._mount_results_body(left_buttons, right_buttons)
+        with self.batch_update():
+            self._clear_wizard()
+            self._arm_back_navigation()
+            self._last_output_target = None
+            self._last_output_text = None
+            left_buttons = self._build_results_left_buttons()
+            self._set_uniform_button_group_widths(left_buttons)
+            self._results_left_group = Horizontal(
+                *left_buttons,
+                classes="left-buttons",
+            )
+            container = self._step_containers.get(WizardStep.RESULTS)
+            if (
+                container is None
+                or self._results_title_label is None
+                or self._results_button_row is None
+            ):
+                self._mount_results_step()
+            else:
+                # Reuse the log widget; only its content and the
+                # state-dependent buttons change between visits.
+                self._reset_results_log()
+                self._results_title_label.update(self._results_title())
+                self._results_button_row.mount(
+                    self._results_left_group,
+                    before=0,
+                )
+                container.display = True
+            self._refresh_footer_bindings()
         self.call_after_refresh(self._focus_results)
-        self._refresh_footer_bindings()
 
     def _search_summary_text(self) -> str:
         if self.subsearch_active:
@@ -2316,25 +2904,27 @@ class LogBrowser(App):
             f"{self.current_kind} across {len(self.selected_logs)} log(s)"
         )
 
-    def _mount_search_controls(self) -> None:
+    def _build_search_controls(self) -> list[Widget]:
         self.search_input = SearchInput(
             placeholder="Enter search term",
             id="search-term",
         )
         self.search_input.add_class("search-term-input")
-        self.wizard.mount(self.search_input)
         self.search_mode_status = Static(
             self._search_mode_status_text(),
             classes="mode-description",
             id="search-mode-status",
         )
-        self.wizard.mount(self.search_mode_status)
         self.result_mode_status = Static(
             self._result_mode_status_text(),
             classes="mode-description",
             id="result-mode-status",
         )
-        self.wizard.mount(self.result_mode_status)
+        return [
+            self.search_input,
+            self.search_mode_status,
+            self.result_mode_status,
+        ]
 
     def _search_back_button_spec(self) -> tuple[str, str]:
         if not self.subsearch_active:
@@ -2382,40 +2972,66 @@ class LogBrowser(App):
         self._set_uniform_button_group_widths(right_buttons)
         return left_buttons, right_buttons
 
-    def _mount_search_button_row(
+    def _build_search_button_row(
         self,
         left_buttons: list[Button],
         right_buttons: list[Button],
-    ) -> None:
-        button_row = Horizontal(
+    ) -> Horizontal:
+        return Horizontal(
             Horizontal(*left_buttons, classes="left-buttons"),
             Static("", classes="button-spacer"),
             Horizontal(*right_buttons, classes="right-buttons"),
             classes="button-row",
         )
-        self.wizard.mount(button_row)
 
-    def _mount_results_header(self) -> None:
+    def _mount_results_step(self) -> None:
         help_text = (
             "Selection: arrows move, Shift+arrows select, "
             "mouse drag works. Right-click for copy."
         )
+        self._results_title_label = Static(
+            self._results_title(),
+            classes="instruction",
+        )
         header_row = Horizontal(
-            Static(self._results_title(), classes="instruction"),
+            self._results_title_label,
             Static("", classes="results-spacer"),
             Static(help_text, classes="results-help"),
             classes="results-header",
         )
-        self.wizard.mount(header_row)
-
-    def _build_results_output_log(self) -> ResultsArea:
-        self._result_log_counter += 1
-        result_id = f"result-log-{self._result_log_counter}"
-        output_log = ResultsArea(id=result_id, classes="result-log")
+        output_log = ResultsArea(id="result-log", classes="result-log")
         output_log.set_visual_theme()
         output_log.styles.height = "1fr"
         output_log.styles.min_height = 5
-        return output_log
+        self.output_log = output_log
+        right_buttons = self._build_results_right_buttons()
+        self._set_uniform_button_group_widths(right_buttons)
+        self._results_button_row = Horizontal(
+            self._results_left_group,
+            Static("", classes="button-spacer"),
+            Horizontal(*right_buttons, classes="right-buttons"),
+            classes="button-row",
+            id="results-buttons",
+        )
+        container = Vertical(
+            header_row,
+            Vertical(
+                output_log,
+                self._results_button_row,
+                classes="results-body",
+            ),
+            classes="wizard-step",
+        )
+        self._step_containers[WizardStep.RESULTS] = container
+        self.wizard.mount(container)
+
+    def _reset_results_log(self) -> None:
+        output_log = self.output_log
+        if not isinstance(output_log, ResultsArea):
+            return
+        output_log.set_log_kind(None)
+        output_log.set_delivery_lookup_links([])
+        output_log.text = ""
 
     def _build_results_left_buttons(self) -> list[Button]:
         if self._search_in_progress:
@@ -2466,28 +3082,6 @@ class LogBrowser(App):
             ),
         ]
 
-    def _mount_results_body(
-        self,
-        left_buttons: list[Button],
-        right_buttons: list[Button],
-    ) -> None:
-        self._set_uniform_button_group_widths(left_buttons)
-        self._set_uniform_button_group_widths(right_buttons)
-        button_row = Horizontal(
-            Horizontal(*left_buttons, classes="left-buttons"),
-            Static("", classes="button-spacer"),
-            Horizontal(*right_buttons, classes="right-buttons"),
-            classes="button-row",
-            id="results-buttons",
-        )
-        assert self.output_log is not None
-        results_body = Vertical(
-            self.output_log,
-            button_row,
-            classes="results-body",
-        )
-        self.wizard.mount(results_body)
-
     # Step helpers -------------------------------------------------------
     def _initial_kind_choice(self, kinds_sorted: list[str]) -> str | None:
         if self.default_kind in self._logs_by_kind:
@@ -2500,24 +3094,28 @@ class LogBrowser(App):
         if not infos:
             return []
         today = date.today()
+        # Logs are sorted newest first, so today's entry, if any, comes
+        # before the first older stamp.
         for idx, info in enumerate(infos):
             if info.stamp == today:
                 return [idx]
+            if info.stamp is None or info.stamp < today:
+                break
         return [0]
 
     def _update_next_button_state(self) -> None:
-        try:
-            next_button = self.wizard.query_one('Button#next-date')
-        except Exception:
-            next_button = None
-        if isinstance(next_button, Button) and self.step == WizardStep.DATE:
-            next_button.disabled = not bool(self.selected_logs)
-        try:
-            kind_next = self.wizard.query_one('Button#next-kind')
-        except Exception:
-            kind_next = None
-        if isinstance(kind_next, Button) and self.step == WizardStep.KIND:
-            kind_next.disabled = not bool(self._logs_by_kind)
+        # The buttons live in cached step containers, so hold them directly
+        # instead of querying the DOM on every selection change.
+        if self.step == WizardStep.DATE:
+            button = self._next_date_button
+            enabled = bool(self.selected_logs)
+        elif self.step == WizardStep.KIND:
+            button = self._next_kind_button
+            enabled = bool(self._logs_by_kind)
+        else:
+            return
+        if button is not None:
+            button.disabled = not enabled
 
     # Events -------------------------------------------------------------
     def on_button_pressed(
@@ -2529,55 +3127,44 @@ class LogBrowser(App):
         button_id = event.button.id
         if button_id is None:
             return
-        if self._search_in_progress and button_id not in {
-            "cancel-search",
-            "quit-results",
-        }:
+        if (
+            self._search_in_progress
+            and button_id not in self._BUTTONS_ALLOWED_DURING_SEARCH
+        ):
             self._notify("Search is running. Wait or press Cancel.")
             return
-        if button_id == "quit-kind":
-            self.exit()
-        elif button_id == "next-kind":
-            if self.current_kind:
-                self._show_step_date()
-        elif button_id == "back-date":
-            self._show_step_kind()
-        elif button_id == "next-date":
-            if self.selected_logs:
-                self._show_step_search()
-        elif button_id == "back-search":
-            self._show_step_date()
-        elif button_id == "back-results":
-            if (
-                self.step == WizardStep.SEARCH
-                and self._is_back_navigation_armed()
-            ):
-                self._show_last_results()
-        elif button_id == "cycle-search-mode":
-            self._cycle_search_mode()
-        elif button_id == "cycle-result-mode":
-            self._cycle_result_mode()
-        elif button_id == "do-search":
-            self._perform_search()
-        elif button_id == "cancel-search":
-            self._cancel_search()
-        elif button_id == "new-search":
-            self._reset_subsearch()
-            self._show_step_kind()
-        elif button_id == "sub-search":
-            self._start_subsearch()
-        elif button_id == "back-subsearch":
-            if self._is_back_navigation_armed():
-                self._step_back_subsearch()
-        elif button_id == "quit-results":
-            self.exit()
-        elif button_id == "copy-selection":
-            self._copy_results(selection_only=True)
-        elif button_id == "copy-all":
-            self._copy_results(selection_only=False)
+        handler_name = self._BUTTON_HANDLERS.get(button_id)
+        if handler_name is not None:
+            getattr(self, handler_name)()
 
         self._refresh_footer_bindings()
 
+    def _next_from_kind(self) -> None:
+        if self.current_kind:
+            self._show_step_date()
+
+    def _next_from_date(self) -> None:
+        if self.selected_logs:
+            self._show_step_search()
+
+    def _back_to_results(self) -> None:
+        if self.step == WizardStep.SEARCH and self._is_back_navigation_armed():
+            self._show_last_results()
+
+    def _start_new_search(self) -> None:
+        self._reset_subsearch()
+        self._show_step_kind()
+
+    def _back_from_subsearch(self) -> None:
+        if self._is_back_navigation_armed():
+            self._step_back_subsearch()
+
+    def _copy_selection(self) -> None:
+        self._copy_results(selection_only=True)
+
+    def _copy_all(self) -> None:
+        self._copy_results(selection_only=False)
+
     def on_top_action_pressed(self, message: TopActionPressed) -> None:
         if message.action == "menu":
             self.action_menu()
@@ -2590,19 +3177,23 @@ class LogBrowser(App):
         self,
         event: ListView.Highlighted,
     ) -> None:  # type: ignore[override]
-        if self.step == WizardStep.KIND:
-            self._highlight_kind_item(event.item)
+        entry = self._list_handlers.get(self.step)
+        if entry is None:
             return
-        if self.step == WizardStep.DATE:
-            self._highlight_date_item(event.item)
+        item_type, highlight, _ = entry
+        if highlight is not None and isinstance(event.item, item_type):
+            highlight(event.item)
 
     def on_list_view_selected(
         self,
         event: ListView.Selected,
     ) -> None:  # type: ignore[override]
-        if self.step == WizardStep.KIND:
-            self._select_kind_item(event.item)
-        return
+        entry = self._list_handlers.get(self.step)
+        if entry is None:
+            return
+        item_type, _, select = entry
+        if select is not None and isinstance(event.item, item_type):
+            select(event.item)
 
     def on_date_selection_changed(self, message: DateSelectionChanged) -> None:
         if self.step != WizardStep.DATE:
@@ -2687,36 +3278,21 @@ class LogBrowser(App):
         self._set_search_running(False)
         self._apply_search_output(result)
 
-    def _highlight_kind_item(self, item: ListItem) -> None:
-        if not isinstance(item, KindListItem):
-            return
+    def _highlight_kind_item(self, item: KindListItem) -> None:
         self.current_kind = item.kind
         if isinstance(self.kind_list, KindListView):
             self.kind_list.set_selection(item.kind)
 
-    def _highlight_date_item(self, item: ListItem) -> None:
-        if not isinstance(item, DateListItem):
-            return
+    def _highlight_date_item(self, item: DateListItem) -> None:
         if self.date_list is None or self.date_list.index is None:
             return
         self.date_list.anchor_index = self.date_list.index
         self.date_list._update_visual_state()
 
-    def _select_kind_item(self, item: ListItem) -> None:
-        if not isinstance(item, KindListItem):
-            return
+    def _select_kind_item(self, item: KindListItem) -> None:
         self.current_kind = item.kind
         self._show_step_date()
 
-    @staticmethod
-    def _child_index(container: ListView, item: ListItem) -> int | None:
-        children = list(container.children)
-        try:
-            return children.index(item)
-        except ValueError:
-            index = container.index
-            return index if index is not None else None
-
     def action_focus_search(self) -> None:
         if self.step == WizardStep.SEARCH and self.search_input is not None:
             self.search_input.focus()
@@ -2748,81 +3324,141 @@ class LogBrowser(App):
         action: str,
         parameters: tuple[object, ...],
     ) -> bool | None:
-        if self._search_in_progress:
-            if action in {
-                "focus_search",
-                "next_search_mode",
-                "prev_search_mode",
-                "raise_fuzzy_threshold",
-                "lower_fuzzy_threshold",
-            }:
-                return False
-        if action == "focus_search":
-            return self.step == WizardStep.SEARCH
-        if action == "next_search_mode":
-            return self.step == WizardStep.SEARCH
-        if action == "prev_search_mode":
-            return self.step == WizardStep.SEARCH
-        if action == "raise_fuzzy_threshold":
-            return (
-                self.step == WizardStep.SEARCH
-                and self.search_mode == MODE_FUZZY
-            )
-        if action == "lower_fuzzy_threshold":
-            return (
-                self.step == WizardStep.SEARCH
-                and self.search_mode == MODE_FUZZY
-            )
+        if action not in _SEARCH_STEP_ACTIONS:
+            return True
+        if self._search_in_progress or self.step != WizardStep.SEARCH:
+            return False
+        if action in _FUZZY_THRESHOLD_ACTIONS:
+            return self.search_mode == MODE_FUZZY
         return True
 
     def action_reset(self) -> None:
         if self._search_in_progress:
             self._notify("Search is running. Cancel before resetting.")
             return
-        self._refresh_logs()
         self.selected_logs = []
         self.current_kind = None
         self._reset_subsearch()
         self._show_step_kind()
         self._refresh_footer_bindings()
+        self._start_log_scan()
+
+    def _start_log_scan(self) -> None:
+        # Scan on a worker so large log folders do not stall the UI; the
+        # kind step shows the last scan until the new one arrives.
+        self.run_worker(
+            partial(self._run_log_scan_job, self.logs_dir),
+            name="log-scan-worker",
+            group="log-scan",
+            thread=True,
+            exclusive=True,
+            exit_on_error=False,
+        )
+
+    def _run_log_scan_job(self, logs_dir: Path) -> None:
+        scan_key = _logs_dir_scan_key(logs_dir)
+        # Adding, removing or renaming a log bumps the folder mtime, so an
+        # unchanged key means the last scan still holds.
+        if scan_key is not None and scan_key == self._logs_scan_key:
+            return
+        try:
+            kinds = group_logs_by_kind(logs_dir)
+        except OSError as exc:
+            if get_current_worker().is_cancelled:
+                return
+            self.call_from_thread(
+                self._apply_log_scan_error,
+                f"Could not scan logs folder {logs_dir}: {exc}",
+            )
+            return
+        if get_current_worker().is_cancelled:
+            return
+        self.call_from_thread(self._apply_scanned_logs, kinds, scan_key)
+
+    def _apply_log_scan_error(self, message: str) -> None:
+        self._notify(message)
+        self._apply_scanned_logs({})
+
+    def _apply_scanned_logs(
+        self,
+        kinds: dict[str, list[LogFileInfo]],
+        scan_key: tuple[Path, int] | None = None,
+    ) -> None:
+        self._logs_scan_key = scan_key
+        was_pending = self._log_scan_pending
+        self._log_scan_pending = False
+        if kinds == self._logs_by_kind and not was_pending:
+            return
+        self._logs_by_kind = kinds
+        if self.step == WizardStep.KIND:
+            # Replace only the list so status messages stay visible.
+            self._replace_kind_list()
+        elif self.step == WizardStep.DATE and self.current_kind not in kinds:
+            self._notify(f"No {self.current_kind} logs remain; choose again.")
+            self._show_step_kind()
+        # Later steps keep their choices; the kind step is rebuilt from
+        # these results when it is shown again.
 
     def _refresh_footer_bindings(self) -> None:
+        # Most actions end with this call, often several per frame; fold
+        # them into one footer refresh after the next screen refresh.
+        if self.footer is None or self._footer_refresh_pending:
+            return
+        self._footer_refresh_pending = True
+        self.call_after_refresh(self._apply_footer_refresh)
+
+    def _apply_footer_refresh(self) -> None:
+        self._footer_refresh_pending = False
         if self.footer is not None:
             # Reset footer legend so shortcuts display on every step.
             self.footer._key_text = None  # type: ignore[attr-defined]
             self.footer.refresh()
 
     def _arm_back_navigation(self) -> None:
-        self._back_navigation_armed_at = (
-            time.perf_counter() + _BACK_NAVIGATION_GUARD_SECONDS
+        self._back_navigation_armed_at_ns = (
+            time.monotonic_ns() + _BACK_NAVIGATION_GUARD_NS
         )
 
     def _is_back_navigation_armed(self) -> bool:
-        return time.perf_counter() >= self._back_navigation_armed_at
+        return time.monotonic_ns() >= self._back_navigation_armed_at_ns
 
     def _apply_kind_selection(self, kind: str) -> None:
-        if not self.kind_list:
+        # The kind list stays mounted while hidden, so a deferred call
+        # must not pull focus back once another step is showing.
+        if not self.kind_list or self.step != WizardStep.KIND:
             return
-        children = list(self.kind_list.children)
-        for idx, child in enumerate(children):
-            if isinstance(child, KindListItem) and child.kind == kind:
-                try:
-                    self.kind_list.index = idx
-                except Exception:
-                    pass
-                if isinstance(self.kind_list, KindListView):
-                    self.kind_list.set_selection(kind)
-                else:
-                    child.set_selected(True)
-                self.kind_list.focus()
-                break
+        idx = self._kind_index_map.get(kind)
+        if idx is None:
+            return
+        try:
+            self.kind_list.index = idx
+        except Exception:
+            pass
+        self.kind_list.set_selection(kind)
+        self.kind_list.focus()
 
     def _clear_wizard(self) -> None:
         if isinstance(self.output_log, ResultsArea):
             self.output_log._end_mouse_interaction()
         if hasattr(self, 'wizard'):
-            for child in list(self.wizard.children):
-                child.remove()
+            cached = set(self._step_containers.values())
+            for container in cached:
+                container.display = False
+            # Cached steps keep their chrome; their lists are rebuilt.
+            stale: list[Widget] = [
+                body
+                for body in (
+                    self.kind_list,
+                    self.date_list,
+                    self._results_left_group,
+                )
+                if body is not None and body.parent is not None
+            ]
+            stale.extend(
+                child for child in self.wizard.children if child not in cached
+            )
+            # One batched prune instead of a remove message per widget.
+            self.wizard.remove_children(stale)
         self.search_input = None
         self.search_mode_status = None
         self.result_mode_status = None
@@ -2859,22 +3495,6 @@ class LogBrowser(App):
         )
 
     # Core behaviour -----------------------------------------------------
-    def _refresh_logs(self) -> None:
-        kinds: Dict[str, List[LogFileInfo]] = {}
-        if self.logs_dir.exists():
-            for path in self.logs_dir.iterdir():
-                if not path.is_file():
-                    continue
-                info = parse_log_filename(path)
-                if not info.kind:
-                    continue
-                kinds.setdefault(info.kind, []).append(info)
-        for kind, infos in list(kinds.items()):
-            kinds[kind] = summarize_logs(self.logs_dir, kind)
-        self._logs_by_kind = kinds
-        if self.current_kind not in self._logs_by_kind:
-            self.current_kind = None
-
     def _perform_search(self) -> None:
         if self._search_in_progress:
             self._notify("Search is already running.")
@@ -2892,8 +3512,10 @@ class LogBrowser(App):
         request: SearchRequest,
         status_message: str,
     ) -> None:
+        self._cancel_log_prefetch()
         self._search_session_id += 1
         session_id = self._search_session_id
+        self._search_cancel_signal = Future()
         self._set_search_running(True)
         self._start_live_results(request)
         self._notify(status_message)
@@ -2907,9 +3529,10 @@ class LogBrowser(App):
         )
 
     def _start_live_results(self, request: SearchRequest) -> None:
-        self._live_rendered_lines = []
-        self._live_delivery_lookup_links = []
-        self._live_pending_results = {}
+        self._live_rendered_lines.clear()
+        self._live_rendered_text = ""
+        self._live_delivery_lookup_links.clear()
+        self._live_pending_results.clear()
         self._live_next_index = 0
         self._live_kind = request.kind
         self._live_result_mode = request.result_mode
@@ -2921,14 +3544,20 @@ class LogBrowser(App):
         )
         self._last_execution_label = None
         self._live_match_total = 0
-        self._live_match_preview_lines = []
+        self._live_match_preview_lines.clear()
         self._last_live_output_refresh_at = 0.0
+        self._last_target_progress = None
         self._search_started_at = time.perf_counter()
         self._first_result_notified = False
         self._show_step_results()
         if isinstance(self.output_log, ResultsArea):
             self.output_log.set_log_kind(request.kind)
         self._request_live_output_refresh(force=True)
+        self._stop_live_output_timer()
+        self._live_output_timer = self.set_interval(
+            _LIVE_OUTPUT_REFRESH_SECONDS,
+            self._on_live_output_tick,
+        )
 
     def _initial_live_execution_label(
         self,
@@ -2946,18 +3575,18 @@ class LogBrowser(App):
             )
             return None
 
-        source_paths: list[Path]
+        source_paths: tuple[Path, ...]
         needs_staging = False
         if self.subsearch_active:
             if self.subsearch_path is None:
                 self._notify("No prior results available for sub-search.")
                 return None
-            source_paths = [self.subsearch_path]
+            source_paths = (self.subsearch_path,)
         else:
             if not self.selected_logs:
                 self._notify("Select at least one log date before searching.")
                 return None
-            source_paths = [info.path for info in self.selected_logs]
+            source_paths = tuple(info.path for info in self.selected_logs)
             needs_staging = True
         search_kind = self.subsearch_kind if self.subsearch_active else None
         if search_kind is None:
@@ -3028,7 +3657,7 @@ class LogBrowser(App):
             result_mode=RESULT_MODE_RELATED_TRAFFIC,
             fuzzy_threshold=self.fuzzy_threshold,
             ignore_case=True,
-            source_paths=[delivery_log.path],
+            source_paths=(delivery_log.path,),
             needs_staging=True,
             use_index_cache=True,
         )
@@ -3048,7 +3677,10 @@ class LogBrowser(App):
             targets,
             search_fn,
             worker,
-            on_result=partial(self._post_live_search_result, session_id),
+            on_result=partial(
+                self._on_live_search_result_for_session,
+                session_id,
+            ),
         )
         return SearchOutput(
             kind=request.kind,
@@ -3058,21 +3690,6 @@ class LogBrowser(App):
             results=results,
         )
 
-    def _post_live_search_result(
-        self,
-        session_id: int,
-        index: int,
-        target: Path,
-        result: SmtpSearchResult,
-    ) -> None:
-        self.call_from_thread(
-            self._on_live_search_result_for_session,
-            session_id,
-            index,
-            target,
-            result,
-        )
-
     def _on_live_search_result_for_session(
         self,
         session_id: int,
@@ -3088,9 +3705,9 @@ class LogBrowser(App):
         self,
         request: SearchRequest,
         worker: Worker[SearchOutput],
-    ) -> list[Path]:
+    ) -> Sequence[Path]:
         if not request.needs_staging:
-            return request.source_paths.copy()
+            return request.source_paths
         self.call_from_thread(
             self._set_live_execution,
             "Staging selected logs...",
@@ -3098,16 +3715,20 @@ class LogBrowser(App):
         assert self.staging_dir is not None
         total = len(request.source_paths)
         targets: list[Path] = []
+        next_progress_ns = 0
         for index, source_path in enumerate(request.source_paths, start=1):
             if worker.is_cancelled:
                 raise WorkerCancelled()
-            self.call_from_thread(
-                self._notify_search_progress,
-                "Staging",
-                index,
-                total,
-                source_path.name,
-            )
+            now_ns = time.monotonic_ns()
+            if now_ns >= next_progress_ns or index == total:
+                next_progress_ns = now_ns + _STAGING_PROGRESS_INTERVAL_NS
+                self.call_from_thread(
+                    self._notify_search_progress,
+                    "Staging",
+                    index,
+                    total,
+                    source_path.name,
+                )
             try:
                 staged = stage_log(
                     source_path,
@@ -3127,7 +3748,7 @@ class LogBrowser(App):
     def _search_targets(
         self,
         request: SearchRequest,
-        targets: list[Path],
+        targets: Sequence[Path],
         search_fn,
         worker: Worker[SearchOutput],
         on_result: Callable[[int, Path, SmtpSearchResult], None] | None = None,
@@ -3145,9 +3766,13 @@ class LogBrowser(App):
             use_index_cache=use_index_cache,
         )
         max_workers = _parallel_worker_count(len(targets))
+        workload_bytes = _target_workload_bytes(targets)
+        # Index probes and sizing touch every target; honour a cancel that
+        # arrived meanwhile before any pool is started.
+        self._raise_if_cancelled(worker)
         plan = choose_search_execution_plan(
             len(targets),
-            _target_workload_bytes(targets),
+            workload_bytes,
             use_index_cache=active_request.use_index_cache,
             max_workers=max_workers,
         )
@@ -3175,12 +3800,13 @@ class LogBrowser(App):
             worker,
             on_result=on_result,
             reason=plan.reason,
+            workload_bytes=workload_bytes,
         )
 
     def _search_targets_serial(
         self,
         request: SearchRequest,
-        targets: list[Path],
+        targets: Sequence[Path],
         search_fn,
         worker: Worker[SearchOutput],
         on_result: Callable[[int, Path, SmtpSearchResult], None] | None = None,
@@ -3194,6 +3820,7 @@ class LogBrowser(App):
                 search_fn,
                 request,
                 target,
+                worker,
                 index=index,
                 total=total,
             )
@@ -3231,16 +3858,19 @@ class LogBrowser(App):
         search_fn,
         request: SearchRequest,
         target: Path,
+        worker: Worker[SearchOutput],
         *,
         index: int,
         total: int,
     ) -> SmtpSearchResult:
         callbacks = _LiveTargetCallbacks(
             self,
+            worker,
             index=index,
             total=total,
             target_name=target.name,
         )
+        self._live_match_source = callbacks
         try:
             return search_fn(
                 target,
@@ -3253,7 +3883,8 @@ class LogBrowser(App):
                 match_callback=callbacks.report_match,
             )
         finally:
-            callbacks.flush(force=True)
+            self._live_match_source = None
+            callbacks.flush()
 
     def _emit_live_result(
         self,
@@ -3264,7 +3895,7 @@ class LogBrowser(App):
     ) -> None:
         if on_result is None:
             return
-        on_result(index - 1, target, result)
+        self.call_from_thread(on_result, index - 1, target, result)
 
     def _notify_target_search_finished(
         self,
@@ -3291,6 +3922,11 @@ class LogBrowser(App):
         safe_total = max(total_bytes, 1)
         scanned = min(max(scanned_bytes, 0), safe_total)
         percent = int((scanned / safe_total) * 100)
+        # Byte ticks within one percent only change the size readout.
+        progress_key = (current, target_name, percent)
+        if progress_key == self._last_target_progress:
+            return
+        self._last_target_progress = progress_key
         scanned_label = _format_size(scanned)
         total_label = _format_size(safe_total)
         detail = (
@@ -3303,30 +3939,82 @@ class LogBrowser(App):
     def _search_targets_parallel(
         self,
         request: SearchRequest,
-        targets: list[Path],
+        targets: Sequence[Path],
         workers: int,
         search_fn,
         worker: Worker[SearchOutput],
         on_result: Callable[[int, Path, SmtpSearchResult], None] | None = None,
         reason: str | None = None,
+        workload_bytes: int | None = None,
     ) -> list[SmtpSearchResult]:
         total = len(targets)
         message = self._parallel_start_message(total, workers, reason)
         self.call_from_thread(self._notify, message)
         self.call_from_thread(self._set_live_progress, message, 0, True)
-        on_completed = self._parallel_on_completed_callback()
+        pool_on_result, on_completed = self._parallel_callbacks(on_result)
+        process_error: Exception | None = None
+        if prefers_process_pool(
+            request.mode,
+            total,
+            workers,
+            workload_bytes,
+        ):
+            # Fuzzy and regex scans are CPU-bound; threads would share
+            # one core under the GIL.
+            self.call_from_thread(
+                self._set_live_execution,
+                "parallel (process workers: CPU-bound mode)",
+            )
+            try:
+                return self._run_process_pool_search(
+                    request,
+                    targets,
+                    workers,
+                    worker,
+                    pool_on_result,
+                    on_completed,
+                )
+            except WorkerCancelled:
+                raise
+            except Exception as process_exc:
+                process_error = process_exc
+                self.call_from_thread(
+                    self._notify,
+                    "Process workers unavailable; using threads. "
+                    f"({type(process_exc).__name__})",
+                )
         try:
             return self._run_thread_pool_search(
                 request,
                 targets,
                 workers,
                 worker,
-                on_result,
+                pool_on_result,
                 on_completed,
             )
         except WorkerCancelled:
             raise
         except Exception as thread_exc:
+            if process_error is not None:
+                # Processes already failed; do not start the pool again.
+                return self._search_targets_via_serial_fallback(
+                    request,
+                    targets,
+                    search_fn,
+                    worker,
+                    on_result,
+                    thread_reason=type(thread_exc).__name__,
+                    process_exc=process_error,
+                )
+            if should_skip_process_pool(workload_bytes):
+                return self._search_targets_via_inline_fallback(
+                    request,
+                    targets,
+                    search_fn,
+                    worker,
+                    on_result,
+                    thread_exc=thread_exc,
+                )
             return self._search_targets_via_process_fallback(
                 request,
                 targets,
@@ -3334,7 +4022,6 @@ class LogBrowser(App):
                 search_fn,
                 worker,
                 on_result,
-                on_completed,
                 thread_exc=thread_exc,
             )
 
@@ -3349,21 +4036,69 @@ class LogBrowser(App):
             return f"{message} ({reason})"
         return message
 
-    def _parallel_on_completed_callback(
+    def _parallel_callbacks(
         self,
-    ) -> Callable[[int, int, Path], None]:
-        return lambda done, count, target: self.call_from_thread(
-            self._notify_search_progress,
-            "Searched",
-            done,
-            count,
-            target.name,
-        )
+        on_result: Callable[[int, Path, SmtpSearchResult], None] | None,
+    ) -> tuple[
+        Callable[[int, Path, SmtpSearchResult], None],
+        Callable[[int, int, Path], None],
+    ]:
+        # Pool drivers report each result, then progress once per task.
+        # Buffer the results and deliver both in one UI-thread call,
+        # skipping calls that would not move the percentage shown.
+        pending: list[tuple[int, Path, SmtpSearchResult]] = []
+        last_percent = -1
+        next_flush_ns = 0
+
+        def buffer_result(
+            index: int,
+            target: Path,
+            result: SmtpSearchResult,
+        ) -> None:
+            pending.append((index, target, result))
+
+        def flush(done: int, count: int, target: Path) -> None:
+            nonlocal last_percent, next_flush_ns
+            percent = done * 100 // count if count else 100
+            now_ns = time.monotonic_ns()
+            if (
+                done < count
+                and percent == last_percent
+                and now_ns < next_flush_ns
+            ):
+                return
+            last_percent = percent
+            next_flush_ns = now_ns + _PARALLEL_PROGRESS_INTERVAL_NS
+            items = pending.copy()
+            pending.clear()
+            self.call_from_thread(
+                self._apply_parallel_batch,
+                on_result,
+                items,
+                done,
+                count,
+                target.name,
+            )
+
+        return buffer_result, flush
+
+    def _apply_parallel_batch(
+        self,
+        on_result: Callable[[int, Path, SmtpSearchResult], None] | None,
+        items: list[tuple[int, Path, SmtpSearchResult]],
+        done: int,
+        count: int,
+        target_name: str,
+    ) -> None:
+        if on_result is not None:
+            for index, target, result in items:
+                on_result(index, target, result)
+        self._notify_search_progress("Searched", done, count, target_name)
 
     def _run_thread_pool_search(
         self,
         request: SearchRequest,
-        targets: list[Path],
+        targets: Sequence[Path],
         workers: int,
         worker: Worker[SearchOutput],
         on_result: Callable[[int, Path, SmtpSearchResult], None] | None,
@@ -3373,38 +4108,87 @@ class LogBrowser(App):
             request,
             targets,
             workers=workers,
+            executor=self._get_thread_pool(workers),
+            cancel_signal=self._search_cancel_signal,
             is_cancelled=lambda: worker.is_cancelled,
             on_result=on_result,
             on_completed=on_completed,
         )
 
+    def _get_thread_pool(self, workers: int) -> ThreadPoolExecutor:
+        """Return the app-wide thread pool sized for ``workers``."""
+
+        # Keyed by size so each plan keeps its own concurrency limit.
+        with self._pool_lock:
+            pool = self._thread_pools.get(workers)
+            if pool is None:
+                pool = ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix="sm-logtool-search",
+                )
+                self._thread_pools[workers] = pool
+            return pool
+
+    def _shutdown_thread_pools(self) -> None:
+        with self._pool_lock:
+            pools = list(self._thread_pools.values())
+            self._thread_pools.clear()
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
     def _run_process_pool_search(
         self,
         request: SearchRequest,
-        targets: list[Path],
+        targets: Sequence[Path],
         workers: int,
         worker: Worker[SearchOutput],
         on_result: Callable[[int, Path, SmtpSearchResult], None] | None,
         on_completed: Callable[[int, int, Path], None] | None,
     ) -> list[SmtpSearchResult]:
-        return _search_targets_in_process_pool(
-            request,
-            targets,
-            workers=workers,
-            is_cancelled=lambda: worker.is_cancelled,
-            on_result=on_result,
-            on_completed=on_completed,
-        )
+        try:
+            return _search_targets_in_process_pool(
+                request,
+                targets,
+                workers=workers,
+                executor=self._get_search_pool(workers),
+                cancel_signal=self._search_cancel_signal,
+                is_cancelled=lambda: worker.is_cancelled,
+                on_result=on_result,
+                on_completed=on_completed,
+            )
+        except BrokenExecutor:
+            self._shutdown_search_pool()
+            raise
+
+    def _get_search_pool(self, workers: int) -> ProcessPoolExecutor:
+        """Return the app-wide process pool, growing it when needed."""
+
+        with self._pool_lock:
+            pool = self._search_pool
+            if pool is not None and self._search_pool_workers >= workers:
+                return pool
+            self._shutdown_search_pool()
+            pool = _new_search_process_pool(workers)
+            self._search_pool = pool
+            self._search_pool_workers = workers
+            return pool
+
+    def _shutdown_search_pool(self) -> None:
+        with self._pool_lock:
+            pool = self._search_pool
+            self._search_pool = None
+            self._search_pool_workers = 0
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def _search_targets_via_process_fallback(
         self,
         request: SearchRequest,
-        targets: list[Path],
+        targets: Sequence[Path],
         workers: int,
         search_fn,
         worker: Worker[SearchOutput],
         on_result: Callable[[int, Path, SmtpSearchResult], None] | None,
-        on_completed: Callable[[int, int, Path], None] | None,
         *,
         thread_exc: Exception,
     ) -> list[SmtpSearchResult]:
@@ -3416,13 +4200,14 @@ class LogBrowser(App):
         )
         process_fallback = f"parallel (process fallback: {thread_reason})"
         self.call_from_thread(self._set_live_execution, process_fallback)
+        pool_on_result, on_completed = self._parallel_callbacks(on_result)
         try:
             return self._run_process_pool_search(
                 request,
                 targets,
                 workers,
                 worker,
-                on_result,
+                pool_on_result,
                 on_completed,
             )
         except WorkerCancelled:
@@ -3438,10 +4223,39 @@ class LogBrowser(App):
                 process_exc=process_exc,
             )
 
+    def _search_targets_via_inline_fallback(
+        self,
+        request: SearchRequest,
+        targets: Sequence[Path],
+        search_fn,
+        worker: Worker[SearchOutput],
+        on_result: Callable[[int, Path, SmtpSearchResult], None] | None,
+        *,
+        thread_exc: Exception,
+    ) -> list[SmtpSearchResult]:
+        thread_reason = type(thread_exc).__name__
+        # Spawning interpreters costs more than scanning a small workload.
+        fallback = (
+            f"serial (parallel fallback: {thread_reason}, small workload)"
+        )
+        self.call_from_thread(self._set_live_execution, fallback)
+        self.call_from_thread(
+            self._notify,
+            "Thread parallel search unavailable; searching small workload "
+            f"serially. ({thread_reason})",
+        )
+        return self._search_targets_serial(
+            request,
+            targets,
+            search_fn,
+            worker,
+            on_result=on_result,
+        )
+
     def _search_targets_via_serial_fallback(
         self,
         request: SearchRequest,
-        targets: list[Path],
+        targets: Sequence[Path],
         search_fn,
         worker: Worker[SearchOutput],
         on_result: Callable[[int, Path, SmtpSearchResult], None] | None,
@@ -3480,7 +4294,24 @@ class LogBrowser(App):
             0,
             force=True,
         )
-        self._live_match_preview_lines = []
+        self._live_match_preview_lines.clear()
+
+    def on_live_match_batch(self, message: LiveMatchBatch) -> None:
+        self._live_batch_slots.release()
+        # Batches are queued, so one can arrive after its target finished
+        # (its lines are then in the rendered results) or after a cancel.
+        if not self._search_in_progress:
+            return
+        if message.worker is not self._search_worker:
+            return
+        if message.current <= self._live_next_index:
+            return
+        self._on_live_target_match_batch(
+            message.current,
+            message.total,
+            message.target_name,
+            message.batch,
+        )
 
     def _on_live_target_match_batch(
         self,
@@ -3493,13 +4324,9 @@ class LogBrowser(App):
             return
         self._live_target_label = f"{current}/{total} {target_name}"
         self._live_match_total += len(batch)
-        for line_number, line in batch:
-            preview_line = f"{target_name}:{line_number}: {line}"
-            self._live_match_preview_lines.append(preview_line)
-        if len(self._live_match_preview_lines) > _LIVE_MATCH_PREVIEW_LINES:
-            self._live_match_preview_lines = self._live_match_preview_lines[
-                -_LIVE_MATCH_PREVIEW_LINES:
-            ]
+        self._live_match_preview_lines.extend(
+            (target_name, line_number, line) for line_number, line in batch
+        )
         self._request_live_output_refresh()
         if not self._first_result_notified:
             elapsed = time.perf_counter() - self._search_started_at
@@ -3512,12 +4339,29 @@ class LogBrowser(App):
         now = time.perf_counter()
         elapsed = now - self._last_live_output_refresh_at
         if not force and elapsed < _LIVE_OUTPUT_REFRESH_SECONDS:
+            self._live_output_dirty = True
             return
         self._last_live_output_refresh_at = now
+        self._live_output_dirty = False
         self._refresh_live_output()
 
+    def _on_live_output_tick(self) -> None:
+        source = self._live_match_source
+        if source is not None:
+            source.flush(wait=False)
+        self._repaint_live_output_if_dirty()
+
+    def _repaint_live_output_if_dirty(self) -> None:
+        if self._live_output_dirty:
+            self._request_live_output_refresh(force=True)
+
+    def _stop_live_output_timer(self) -> None:
+        self._live_output_dirty = False
+        if self._live_output_timer is not None:
+            self._live_output_timer.stop()
+            self._live_output_timer = None
+
     def _refresh_live_output(self) -> None:
-        lines = self._live_rendered_lines.copy()
         output_lines: list[str] = []
         if isinstance(self.output_log, ResultsArea):
             self.output_log.set_delivery_lookup_links([])
@@ -3549,13 +4393,27 @@ class LogBrowser(App):
             if output_lines:
                 output_lines.append("")
             output_lines.extend([header, ""])
-            output_lines.extend(self._live_match_preview_lines)
+            output_lines.extend(
+                f"{name}:{line_number}: {line}"
+                for name, line_number, line in self._live_match_preview_lines
+            )
 
-        if lines:
+        text = "\n".join(output_lines)
+        if self._live_rendered_lines:
             if output_lines:
-                output_lines.extend(["", "[completed targets]", ""])
-            output_lines.extend(lines)
-        self._write_output_lines(output_lines)
+                text += "\n\n[completed targets]\n\n"
+            text += self._live_rendered_text
+        self._write_output_text(text)
+
+    def _append_live_rendered_lines(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        chunk = "\n".join(lines)
+        if self._live_rendered_lines:
+            self._live_rendered_text += "\n" + chunk
+        else:
+            self._live_rendered_text = chunk
+        self._live_rendered_lines.extend(lines)
 
     def _on_live_search_result(
         self,
@@ -3576,14 +4434,14 @@ class LogBrowser(App):
                 result_mode=self._live_result_mode,
             )
             offset = len(self._live_rendered_lines)
-            self._live_rendered_lines.extend(rendered_view.lines)
+            self._append_live_rendered_lines(rendered_view.lines)
             self._live_delivery_lookup_links.extend(
                 _shift_delivery_lookup_links(
                     rendered_view.delivery_lookup_links,
                     offset,
                 )
             )
-            self._live_match_preview_lines = []
+            self._live_match_preview_lines.clear()
             self._request_live_output_refresh(force=True)
             self._live_next_index += 1
             if not self._first_result_notified:
@@ -3643,15 +4501,18 @@ class LogBrowser(App):
         return summary + lines
 
     def _apply_search_output(self, output: SearchOutput) -> None:
-        rendered_view = self._render_result_view(
-            output.results,
-            output.targets,
-            output.kind,
-            output.result_mode,
-        )
+        rendered_view = self._live_result_view(output)
+        if rendered_view is None:
+            rendered_view = self._render_result_view(
+                output.results,
+                output.targets,
+                output.kind,
+                output.result_mode,
+            )
+            self._live_rendered_lines = rendered_view.lines.copy()
+            self._live_rendered_text = "\n".join(rendered_view.lines)
         rendered_lines = rendered_view.lines
-        self._live_rendered_lines = rendered_lines.copy()
-        self._live_pending_results = {}
+        self._live_pending_results.clear()
         self._last_execution_label = self._live_execution_label
         self._write_subsearch_snapshot(
             output.results,
@@ -3679,23 +4540,37 @@ class LogBrowser(App):
         )
         self._schedule_index_warmup(output.kind, output.targets)
 
+    def _live_result_view(
+        self,
+        output: SearchOutput,
+    ) -> _RenderedResultView | None:
+        # Targets render independently, so when every result was already
+        # rendered live, in order, the final view is that same output.
+        if self._live_next_index != len(output.results):
+            return None
+        if self._live_kind != output.kind:
+            return None
+        if self._live_result_mode != output.result_mode:
+            return None
+        return _RenderedResultView(
+            self._live_rendered_lines.copy(),
+            self._live_delivery_lookup_links.copy(),
+        )
+
     def _schedule_index_warmup(
         self,
         kind: str,
-        targets: list[Path],
+        targets: Sequence[Path],
     ) -> None:
-        pending = [
-            path
-            for path in targets
-            if not has_search_index(path, kind)
-        ]
-        if not pending:
+        if not targets:
             return
         worker = self._index_worker
         if worker is not None and not worker.is_finished:
             return
+        # The job skips targets that are already indexed, so the UI thread
+        # does no per-target stat work when a search completes.
         self._index_worker = self.run_worker(
-            partial(self._run_index_warmup_job, kind, pending),
+            partial(self._run_index_warmup_job, kind, targets),
             name="index-warmup-worker",
             group="index-warmup",
             thread=True,
@@ -3706,13 +4581,15 @@ class LogBrowser(App):
     def _run_index_warmup_job(
         self,
         kind: str,
-        targets: list[Path],
+        targets: Sequence[Path],
     ) -> None:
         worker = get_current_worker()
         for target in targets:
             if worker.is_cancelled:
                 return
             try:
+                if has_search_index(target, kind):
+                    continue
                 prime_search_index(target, kind)
             except Exception:
                 return
@@ -3726,17 +4603,21 @@ class LogBrowser(App):
             self._notify("No active search to cancel.")
             return
         worker.cancel()
+        signal = self._search_cancel_signal
+        if signal is not None and not signal.done():
+            signal.set_result(None)
         self._notify("Cancel requested. Waiting for worker to stop...")
 
     def _set_search_running(self, running: bool) -> None:
         self._search_in_progress = running
         if not running:
+            self._stop_live_output_timer()
             self._search_worker = None
-            self._live_pending_results = {}
+            self._live_pending_results.clear()
             self._live_target_label = None
             self._live_progress_label = None
             self._live_progress_percent = 0
-            self._live_match_preview_lines = []
+            self._live_match_preview_lines.clear()
             self._live_match_total = 0
         if self.search_input is not None:
             self.search_input.disabled = running
@@ -3902,9 +4783,11 @@ class LogBrowser(App):
             self._notify(str(exc))
 
     def _write_output_lines(self, lines: list[str]) -> None:
+        self._write_output_text("\n".join(lines))
+
+    def _write_output_text(self, text: str) -> None:
         if self.output_log is None:
             return
-        text = "\n".join(lines)
         if self.output_log is not self._last_output_target:
             self._last_output_target = self.output_log
             self._last_output_text = None
@@ -3994,8 +4877,14 @@ class LogBrowser(App):
         return selected or None
 
     def _get_full_results_text(self) -> str | None:
-        if self.last_rendered_lines:
-            return "\n".join(self.last_rendered_lines).rstrip("\n")
+        lines = self.last_rendered_lines
+        if lines:
+            cached = self._full_results_text
+            if cached is not None and cached[0] is lines:
+                return cached[1]
+            text = "\n".join(lines).rstrip("\n")
+            self._full_results_text = (lines, text)
+            return text
         if isinstance(self.output_log, ResultsArea):
             return self.output_log.text
         return None
@@ -4019,7 +4908,7 @@ class LogBrowser(App):
     def _render_results(
         self,
         results: list,
-        targets: list[Path],
+        targets: Sequence[Path],
         kind: str,
         result_mode: str,
     ) -> list[str]:
@@ -4033,7 +4922,7 @@ class LogBrowser(App):
     def _render_result_view(
         self,
         results: list,
-        targets: list[Path],
+        targets: Sequence[Path],
         kind: str,
         result_mode: str,
     ) -> _RenderedResultView:
@@ -4134,20 +5023,16 @@ class LogBrowser(App):
         if not self.subsearch_active:
             self._reset_subsearch()
         output_path = self._subsearch_output_path()
-        lines: list[str] = []
-        if result_mode == RESULT_MODE_MATCHING_ROWS:
-            for result in results:
-                for _line_number, line in result.matching_rows:
-                    lines.append(line)
-        else:
-            for result in results:
-                for conversation in result.conversations:
-                    lines.extend(conversation.lines)
-                for _line_number, line in result.orphan_matches:
-                    lines.append(line)
-        with output_path.open("w", encoding="utf-8") as handle:
-            for line in lines:
-                handle.write(f"{line}\n")
+        with output_path.open(
+            "w",
+            encoding="utf-8",
+            buffering=_SNAPSHOT_WRITE_BUFFER_BYTES,
+        ) as handle:
+            write = handle.write
+            for block in _snapshot_line_blocks(results, result_mode):
+                if block:
+                    write("\n".join(block))
+                    write("\n")
         self.subsearch_path = output_path
         self.subsearch_depth += 1
         self.subsearch_terms.append(term)
@@ -4248,13 +5133,14 @@ def list_log_files(logs_dir: Path) -> list[Path]:
     Retained for compatibility with legacy tests.
     """
 
-    if not logs_dir.exists() or not logs_dir.is_dir():
+    if not logs_dir.is_dir():
         return []
-    return sorted(
-        p
-        for p in logs_dir.iterdir()
-        if p.is_file() and not p.name.startswith(".")
-    )
+    with os.scandir(logs_dir) as entries:
+        return sorted(
+            Path(entry.path)
+            for entry in entries
+            if not entry.name.startswith(".") and entry.is_file()
+        )
 
 
 def run(
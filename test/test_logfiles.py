@@ -38,3 +38,27 @@ def test_parse_stamp_rejects_invalid_value():
         assert "Invalid log date stamp" in str(exc)
     else:
         raise AssertionError("Expected UnknownLogDate to be raised")
+
+
+def test_log_file_info_uses_slots(tmp_path):
+    info = logfiles.parse_log_filename(tmp_path / "2024.01.01-smtpLog.log")
+
+    assert not hasattr(info, "__dict__")
+    assert info.base_name == "2024.01.01-smtpLog.log"
+
+
+def test_group_logs_by_kind_matches_per_kind_discovery(tmp_path):
+    logs_dir = tmp_path / "logs"
+    logs_dir.mkdir()
+    (logs_dir / "2024.01.01-smtpLog.log").write_text("\n")
+    (logs_dir / "2024.01.02-smtpLog.log").write_text("\n")
+    (logs_dir / "2024.01.02-imapLog.log").write_text("\n")
+    (logs_dir / "notes.txt").write_text("\n")
+    (logs_dir / "2024.01.03-smtpLog.log").mkdir()
+
+    grouped = logfiles.group_logs_by_kind(logs_dir)
+
+    assert sorted(grouped) == ["imap", "smtp"]
+    for kind, infos in grouped.items():
+        assert infos == logfiles.discover_logs(logs_dir, kind)
+    assert logfiles.group_logs_by_kind(tmp_path / "missing") == {}
@@ -1,4 +1,6 @@
 from sm_logtool.search_planning import choose_search_execution_plan
+from sm_logtool.search_planning import prefers_process_pool
+from sm_logtool.search_planning import should_skip_process_pool
 
 
 def test_plan_uses_serial_for_single_target():
@@ -76,3 +78,20 @@ def test_plan_uses_bounded_workers_for_large_workload():
     )
     assert plan.workers == 4
     assert "large workload" in plan.reason
+
+
+def test_process_pool_is_skipped_only_for_known_small_workloads():
+    assert should_skip_process_pool(1024)
+    assert not should_skip_process_pool(64 * 1024 * 1024)
+    assert not should_skip_process_pool(0)
+    assert not should_skip_process_pool(None)
+
+
+def test_process_pool_is_preferred_only_for_large_cpu_bound_searches():
+    large = 512 * 1024 * 1024
+    assert prefers_process_pool("fuzzy", 4, 4, large)
+    assert prefers_process_pool("regex", 6, 4, large)
+    assert not prefers_process_pool("literal", 4, 4, large)
+    assert not prefers_process_pool("fuzzy", 3, 4, large)
+    assert not prefers_process_pool("fuzzy", 4, 4, 1024)
+    assert not prefers_process_pool("fuzzy", 4, 4, None)
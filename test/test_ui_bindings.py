@@ -1,11 +1,18 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
+from types import SimpleNamespace
+import os
+import threading
 import time
 
 import pytest
 from rich.text import Text
 from textual.containers import Horizontal
+from textual.geometry import Offset
+from textual.selection import Selection
 from textual.widgets import Button, Static
+from textual.worker import WorkerCancelled
 
 from sm_logtool import config as config_module
 from sm_logtool.result_modes import RESULT_MODE_MATCHING_ROWS
@@ -17,6 +24,7 @@ from sm_logtool.ui.app import (
     DELIVERY_LOOKUP_LINK_TEXT,
     LogBrowser,
     ResultsArea,
+    SearchOutput,
     SearchRequest,
     TopAction,
     WizardStep,
@@ -49,6 +57,31 @@ def write_sample_logs_for_dates(root: Path, stamps: list[str]) -> None:
         )
 
 
+def _smtp_request(*source_paths: Path, **overrides) -> SearchRequest:
+    fields: dict[str, object] = {
+        "kind": "smtp",
+        "term": "Connection",
+        "mode": "literal",
+        "result_mode": "related",
+        "fuzzy_threshold": 0.75,
+        "ignore_case": True,
+        "source_paths": source_paths,
+        "needs_staging": False,
+        "use_index_cache": False,
+    }
+    fields.update(overrides)
+    return SearchRequest(**fields)  # type: ignore[arg-type]
+
+
+def _idle_worker() -> SimpleNamespace:
+    return SimpleNamespace(is_cancelled=False)
+
+
+async def _wait_for_log_scan(app: LogBrowser, pilot) -> None:
+    await app.workers.wait_for_complete()
+    await pilot.pause()
+
+
 def test_run_prunes_staging_on_startup_and_quit(tmp_path, monkeypatch):
     logs_dir = tmp_path / "logs"
     write_sample_logs(logs_dir)
@@ -261,7 +294,7 @@ async def test_footer_hides_core_shortcuts_outside_search_step(tmp_path):
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -289,7 +322,7 @@ async def test_reset_shortcut_returns_to_kind_step(tmp_path):
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -301,13 +334,155 @@ async def test_reset_shortcut_returns_to_kind_step(tmp_path):
         assert app.step == WizardStep.KIND
 
 
+@pytest.mark.asyncio
+async def test_reset_rescans_logs_on_a_worker(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    app = LogBrowser(logs_dir=logs_dir)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        assert "imap" not in app._logs_by_kind
+        (logs_dir / "2024.01.01-imapLog.log").write_text(
+            "00:00:00 [1.1.1.1] Connected\n",
+            encoding="utf-8",
+        )
+
+        app.action_reset()
+        assert app.step == WizardStep.KIND
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert "imap" in app._logs_by_kind
+        assert app.step == WizardStep.KIND
+        assert app.kind_list is not None
+        assert any(
+            getattr(item, "kind", None) == "imap"
+            for item in app.kind_list.children
+        )
+
+
+@pytest.mark.asyncio
+async def test_startup_scans_logs_on_a_worker(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    app = LogBrowser(logs_dir=logs_dir)
+    async with app.run_test() as pilot:
+        app._notify("startup note")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert app._log_scan_pending is False
+        assert app._logs_by_kind
+        assert app.kind_list is not None
+        assert any(
+            isinstance(item, ui_app_module.KindListItem)
+            for item in app.kind_list.children
+        )
+        status = app.wizard.query_one("#status", Static)
+        assert "startup note" in str(status.render())
+
+
+@pytest.mark.asyncio
+async def test_late_log_scan_keeps_wizard_choices(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    (logs_dir / "2024.01.01-imapLog.log").write_text("", encoding="utf-8")
+    app = LogBrowser(logs_dir=logs_dir)
+    async with app.run_test() as pilot:
+        await _wait_for_log_scan(app, pilot)
+        kinds = dict(app._logs_by_kind)
+        app.current_kind = "imap"
+        app._apply_scanned_logs({**kinds, "delivery": []})
+        await pilot.pause()
+        assert app.current_kind == "imap"
+
+        app.selected_logs = kinds["imap"]
+        app._show_step_search()
+        await pilot.pause()
+        app._apply_scanned_logs({"smtp": kinds["smtp"]})
+        await pilot.pause()
+        assert app.step == WizardStep.SEARCH
+        assert app.current_kind == "imap"
+
+
+@pytest.mark.asyncio
+async def test_late_log_scan_leaves_date_step_when_kind_vanishes(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    app = LogBrowser(logs_dir=logs_dir)
+    async with app.run_test() as pilot:
+        await _wait_for_log_scan(app, pilot)
+        app.current_kind = "smtp"
+        app._show_step_date()
+        await pilot.pause()
+
+        app._apply_scanned_logs({})
+        await pilot.pause()
+
+        assert app.step == WizardStep.KIND
+        assert app.current_kind is None
+
+
+@pytest.mark.asyncio
+async def test_startup_scan_reports_unreadable_logs_folder(tmp_path):
+    logs_dir = tmp_path / "not-a-folder"
+    logs_dir.write_text("", encoding="utf-8")
+    app = LogBrowser(logs_dir=logs_dir)
+    async with app.run_test() as pilot:
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+
+        assert app._log_scan_pending is False
+        assert app._logs_by_kind == {}
+        assert app.kind_list is not None
+        labels = [
+            str(label.render()) for label in app.kind_list.query(Static)
+        ]
+        assert labels == ["No logs discovered"]
+        status = app.wizard.query_one("#status", Static)
+        assert "Could not scan logs folder" in str(status.render())
+
+
+def test_log_scan_skips_unchanged_folder(tmp_path, monkeypatch):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    app = LogBrowser(logs_dir=logs_dir)
+    applied: list[object] = []
+    scans: list[Path] = []
+    monkeypatch.setattr(
+        ui_app_module,
+        "get_current_worker",
+        _idle_worker,
+    )
+    monkeypatch.setattr(
+        app,
+        "call_from_thread",
+        lambda _callback, _kinds, key: applied.append(key),
+    )
+    monkeypatch.setattr(
+        ui_app_module,
+        "group_logs_by_kind",
+        lambda path: scans.append(path) or {},
+    )
+
+    app._run_log_scan_job(logs_dir)
+    app._logs_scan_key = applied[-1]  # type: ignore[assignment]
+    app._run_log_scan_job(logs_dir)
+    assert scans == [logs_dir]
+
+    (logs_dir / "2024.01.02-imapLog.log").write_text("", encoding="utf-8")
+    os.utime(logs_dir, ns=(0, 1))
+    app._run_log_scan_job(logs_dir)
+    assert scans == [logs_dir, logs_dir]
+
+
 @pytest.mark.asyncio
 async def test_top_reset_button_returns_to_kind_step(tmp_path):
     logs_dir = tmp_path / "logs"
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -326,7 +501,7 @@ async def test_quit_shortcut_sets_exit_flag(tmp_path):
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -343,7 +518,7 @@ async def test_search_step_mode_controls_cycle(tmp_path):
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -379,7 +554,7 @@ async def test_search_step_mode_shortcuts_cycle_with_input_focus(tmp_path):
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -448,7 +623,7 @@ async def test_kind_and_date_steps_use_compact_uniform_action_buttons(
             for button in kind_buttons
         )
 
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -457,7 +632,8 @@ async def test_kind_and_date_steps_use_compact_uniform_action_buttons(
 
         assert app.date_list is not None
         assert "selection-list" in app.date_list.classes
-        date_row = app.wizard.query_one(".button-row", Horizontal)
+        date_row = app.wizard.query_one("#next-date", Button).parent
+        assert isinstance(date_row, Horizontal)
         date_buttons = list(date_row.query(Button))
         assert date_buttons
         assert all(
@@ -471,6 +647,59 @@ async def test_kind_and_date_steps_use_compact_uniform_action_buttons(
         )
 
 
+@pytest.mark.asyncio
+async def test_kind_and_date_steps_reuse_cached_containers(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    app = LogBrowser(logs_dir=logs_dir)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await _wait_for_log_scan(app, pilot)
+        kind = next(iter(app._logs_by_kind))
+        app.current_kind = kind
+        app._show_step_date()
+        await pilot.pause()
+        date_next = app.wizard.query_one("#next-date", Button)
+
+        app._show_step_kind()
+        await pilot.pause()
+        app.current_kind = kind
+        app._show_step_date()
+        await pilot.pause()
+
+        assert app.wizard.query_one("#next-date", Button) is date_next
+        visible = [
+            child for child in app.wizard.children if child.display
+        ]
+        assert len(visible) == 1
+        assert app.date_list in visible[0].children
+        assert len(list(app.wizard.query(ui_app_module.DateListView))) == 1
+
+
+@pytest.mark.asyncio
+async def test_results_step_reuses_cleared_results_area(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    app = LogBrowser(logs_dir=logs_dir)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        app._display_results(["first", "second"], "smtp")
+        await pilot.pause()
+        output_log = app.output_log
+        assert isinstance(output_log, ResultsArea)
+        assert output_log.text == "first\nsecond"
+
+        app._show_step_kind()
+        await pilot.pause()
+        app._show_step_results()
+        await pilot.pause()
+
+        assert app.output_log is output_log
+        assert output_log.text == ""
+        assert len(list(app.wizard.query("#results-buttons"))) == 1
+        assert len(list(app.wizard.query("#new-search"))) == 1
+
+
 @pytest.mark.asyncio
 async def test_search_and_results_steps_use_explicit_button_groups(tmp_path):
     logs_dir = tmp_path / "logs"
@@ -483,7 +712,7 @@ async def test_search_and_results_steps_use_explicit_button_groups(tmp_path):
                 return rendered.plain
             return str(button.label)
 
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -545,7 +774,7 @@ async def test_fuzzy_threshold_shortcuts_adjust_value(tmp_path):
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -576,7 +805,7 @@ async def test_copy_selection_button_sends_terminal_clipboard_text(
     app = LogBrowser(logs_dir=logs_dir)
     copied: dict[str, str] = {}
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -610,7 +839,7 @@ async def test_copy_all_button_sends_terminal_clipboard_text(
     app = LogBrowser(logs_dir=logs_dir)
     copied: dict[str, str] = {}
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -640,7 +869,7 @@ async def test_search_step_cycles_result_mode_and_builds_request(tmp_path):
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir, staging_dir=staging_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -665,7 +894,7 @@ async def test_search_step_busy_state_toggles_controls(tmp_path):
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -710,9 +939,9 @@ async def test_perform_search_notifies_submit_immediately(
     def _run_worker_stub(*_args, **_kwargs):
         return _WorkerStub()
 
-    monkeypatch.setattr(app, "run_worker", _run_worker_stub)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
+        monkeypatch.setattr(app, "run_worker", _run_worker_stub)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -752,14 +981,9 @@ def test_start_live_results_sets_initial_execution_label(
     logs_dir = tmp_path / "logs"
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir, staging_dir=tmp_path / "staging")
-    request = SearchRequest(
-        kind="smtp",
-        term="Connection",
-        mode="literal",
+    request = _smtp_request(
+        logs_dir / "2024.01.01-smtpLog.log",
         result_mode=RESULT_MODE_MATCHING_ROWS,
-        fuzzy_threshold=0.6,
-        ignore_case=True,
-        source_paths=[logs_dir / "2024.01.01-smtpLog.log"],
         needs_staging=needs_staging,
         use_index_cache=needs_staging,
     )
@@ -886,6 +1110,152 @@ def test_smtp_subsearch_result_view_reuses_prior_delivery_link_date(
     ]
 
 
+def test_byte_offsets_map_code_points_to_utf8_offsets():
+    assert ui_app_module._byte_offsets("") == [0]
+    assert ui_app_module._byte_offsets("abc") == [0, 1, 2, 3]
+    assert ui_app_module._byte_offsets("a\u00e9\u65e5b") == [0, 1, 3, 6, 7]
+
+
+def test_output_log_constructs_on_installed_textual(monkeypatch):
+    monkeypatch.setattr(ui_app_module.OutputLog, "_rejected_kwargs", ())
+
+    log = ui_app_module.OutputLog(id="output")
+    again = ui_app_module.OutputLog()
+
+    assert log.id == "output"
+    assert again.id is None
+    assert log.can_focus
+
+
+def test_output_log_drops_only_rejected_log_keywords(monkeypatch):
+    base = ui_app_module.OutputLog.__mro__[1]
+    accepted: list[dict[str, object]] = []
+    original_init = base.__init__
+
+    def fake_init(self, *, wrap=None, highlight=None, **kwargs):
+        accepted.append(dict(kwargs, wrap=wrap, highlight=highlight))
+        if "markup" in kwargs:
+            raise TypeError(
+                "__init__() got an unexpected keyword argument 'markup'"
+            )
+        original_init(self, id=kwargs["id"], classes=kwargs["classes"])
+
+    monkeypatch.setattr(base, "__init__", fake_init)
+    monkeypatch.setattr(ui_app_module.OutputLog, "_rejected_kwargs", ())
+
+    log = ui_app_module.OutputLog(id="output", classes="results")
+
+    assert log.id == "output"
+    assert accepted[-1]["wrap"] is True
+    assert accepted[-1]["max_lines"] == ui_app_module._OUTPUT_LOG_MAX_LINES
+    assert "markup" not in accepted[-1]
+    assert ui_app_module.OutputLog._rejected_kwargs == ("markup",)
+
+
+def test_output_log_reraises_unrelated_type_errors(monkeypatch):
+    base = ui_app_module.OutputLog.__mro__[1]
+
+    def fake_init(self, **_kwargs):
+        raise TypeError("unsupported operand type(s)")
+
+    monkeypatch.setattr(base, "__init__", fake_init)
+    monkeypatch.setattr(ui_app_module.OutputLog, "_rejected_kwargs", ())
+
+    with pytest.raises(TypeError, match="unsupported operand"):
+        ui_app_module.OutputLog()
+
+
+def test_update_selections_assigns_new_dict_without_mutate_reactive():
+    original = {"other": "kept"}
+    screen = SimpleNamespace(selections=original)
+
+    ui_app_module._update_selections(screen, "log", "range")
+    assert screen.selections == {"other": "kept", "log": "range"}
+    assert screen.selections is not original
+    assert original == {"other": "kept"}
+
+    ui_app_module._update_selections(screen, "log", None)
+    assert screen.selections == {"other": "kept"}
+
+
+def test_update_selections_mutates_in_place_with_mutate_reactive():
+    mutated: list[object] = []
+
+    class Screen:
+        selections: dict[str, str] = {}
+
+        def mutate_reactive(self, field):
+            mutated.append(field)
+
+    screen = Screen()
+    screen.selections = {}
+    selections = screen.selections
+
+    ui_app_module._update_selections(screen, "log", "range")
+    assert screen.selections is selections
+    assert selections == {"log": "range"}
+    assert mutated == [Screen.selections]
+
+
+@pytest.mark.asyncio
+async def test_output_log_clear_selection_notifies_widget(tmp_path):
+    app = LogBrowser(logs_dir=tmp_path)
+    async with app.run_test() as pilot:
+        log = ui_app_module.OutputLog()
+        await app.screen.mount(log)
+        log.write("alpha\n")
+        await pilot.pause()
+        updates: list[object] = []
+        log.selection_updated = updates.append  # type: ignore[method-assign]
+
+        log._set_selection(Offset(0, 0), Offset(3, 0))
+        await pilot.pause()
+        assert updates and updates[-1] is not None
+
+        log.clear_selection()
+        await pilot.pause()
+        assert updates[-1] is None
+        assert log not in app.screen.selections
+
+
+@pytest.mark.asyncio
+async def test_output_log_throttled_drag_applies_latest_cursor(tmp_path):
+    app = LogBrowser(logs_dir=tmp_path)
+    async with app.run_test() as pilot:
+        log = ui_app_module.OutputLog()
+        await app.screen.mount(log)
+        log.write("alpha beta\n")
+        await pilot.pause()
+        log._mouse_selecting = True
+        log._selection_anchor = Offset(0, 0)
+
+        log._selection_cursor = Offset(2, 0)
+        log._schedule_drag_selection()
+        log._selection_cursor = Offset(6, 0)
+        log._schedule_drag_selection()
+        assert app.screen.selections[log] == Selection.from_offsets(
+            Offset(0, 0),
+            Offset(2, 0),
+        )
+
+        await pilot.pause(ui_app_module._SELECTION_MOVE_INTERVAL * 4)
+        assert app.screen.selections[log] == Selection.from_offsets(
+            Offset(0, 0),
+            Offset(6, 0),
+        )
+
+
+def test_target_workload_bytes_sums_target_sizes(tmp_path):
+    first = tmp_path / "a.log"
+    second = tmp_path / "b.log"
+    first.write_bytes(b"x" * 5)
+    second.write_bytes(b"y" * 7)
+
+    workload = ui_app_module._target_workload_bytes
+    assert workload([first, second]) == 12
+    assert workload([first, tmp_path / "missing.log"]) == 0
+
+
 @pytest.mark.asyncio
 async def test_results_area_end_mouse_interaction_releases_capture(tmp_path):
     logs_dir = tmp_path / "logs"
@@ -937,6 +1307,37 @@ async def test_results_area_ignores_middle_mouse_down(tmp_path):
         assert event.stopped is True
 
 
+@pytest.mark.asyncio
+async def test_results_area_skips_rebuild_for_unchanged_kind_and_links(
+    tmp_path,
+):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    app = LogBrowser(logs_dir=logs_dir)
+    link = _DeliveryLookupLink(0, "67518204", date(2024, 1, 1))
+
+    async with app.run_test() as pilot:
+        app._show_step_results()
+        await pilot.pause()
+        area = app.wizard.query_one(ResultsArea)
+        area.set_log_kind("smtp")
+        area.set_delivery_lookup_links([link])
+        builds: list[str] = []
+        area._build_highlight_map = (  # type: ignore[method-assign]
+            lambda: builds.append("build")
+        )
+
+        area.set_log_kind("smtp")
+        area.set_delivery_lookup_links([link])
+        assert builds == []
+
+        ui_app_module._cached_spans("smtp", "cached line")
+        area.set_delivery_lookup_links([])
+        area.set_log_kind("delivery")
+        assert builds == ["build", "build"]
+        assert ui_app_module._cached_spans.cache_info().currsize > 0
+
+
 @pytest.mark.asyncio
 async def test_delivery_lookup_link_activates_on_mouse_up(tmp_path):
     logs_dir = tmp_path / "logs"
@@ -1086,7 +1487,7 @@ def test_delivery_lookup_request_targets_same_day_delivery_log(tmp_path):
     assert request.kind == "delivery"
     assert request.term == "67518204"
     assert request.mode == "literal"
-    assert request.source_paths == [delivery_log]
+    assert request.source_paths == (delivery_log,)
     assert request.needs_staging is True
 
 
@@ -1129,7 +1530,7 @@ async def test_stale_back_results_button_event_is_ignored(tmp_path):
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -1153,7 +1554,7 @@ async def test_stale_back_subsearch_button_event_is_ignored(tmp_path):
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -1186,7 +1587,7 @@ async def test_back_subsearch_requires_arm_after_results_redraw(tmp_path):
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -1205,7 +1606,7 @@ async def test_back_subsearch_requires_arm_after_results_redraw(tmp_path):
         await pilot.pause()
 
         back_button = app.wizard.query_one("#back-subsearch", Button)
-        app._back_navigation_armed_at = time.perf_counter() + 60
+        app._back_navigation_armed_at_ns = time.monotonic_ns() + 60 * 10**9
         app.on_button_pressed(Button.Pressed(back_button))
         await pilot.pause()
 
@@ -1213,7 +1614,7 @@ async def test_back_subsearch_requires_arm_after_results_redraw(tmp_path):
         assert isinstance(app.output_log, ResultsArea)
         assert app.output_log.text == "current-result-line"
 
-        app._back_navigation_armed_at = 0.0
+        app._back_navigation_armed_at_ns = 0
         app.on_button_pressed(Button.Pressed(back_button))
         await pilot.pause()
 
@@ -1245,6 +1646,20 @@ async def test_target_progress_status_is_determinate(tmp_path):
         assert "(512.0B/1.0KB)" in status_text
 
 
+def test_target_progress_skips_unchanged_percent(tmp_path, monkeypatch):
+    app = LogBrowser(logs_dir=tmp_path)
+    details: list[str] = []
+    monkeypatch.setattr(app, "_notify", details.append)
+
+    app._notify_target_search_progress(1, 2, "one.log", 500, 1000)
+    app._notify_target_search_progress(1, 2, "one.log", 505, 1000)
+    app._notify_target_search_progress(1, 2, "one.log", 510, 1000)
+    app._notify_target_search_progress(2, 2, "two.log", 505, 1000)
+
+    assert len(details) == 3
+    assert details[1].endswith("51% (510.0B/1000.0B)")
+
+
 def test_live_progress_updates_are_throttled(tmp_path, monkeypatch):
     logs_dir = tmp_path / "logs"
     write_sample_logs(logs_dir)
@@ -1334,6 +1749,64 @@ def test_live_match_preview_batches_are_throttled(tmp_path, monkeypatch):
 
     assert refreshes == [300.0, 300.12]
 
+    clock["value"] = 300.14
+    app._on_live_target_match_batch(1, 1, "one.log", batch)
+    app._repaint_live_output_if_dirty()
+    app._repaint_live_output_if_dirty()
+
+    assert refreshes == [300.0, 300.12, 300.14]
+
+
+def test_live_match_preview_keeps_most_recent_lines(tmp_path, monkeypatch):
+    app = LogBrowser(logs_dir=tmp_path)
+    app._search_started_at = 0.0
+    monkeypatch.setattr(app, "_notify", lambda _message: None)
+    limit = ui_app_module._LIVE_MATCH_PREVIEW_LINES
+
+    batch = [(number, "hit") for number in range(limit + 5)]
+    app._on_live_target_match_batch(1, 1, "one.log", batch)
+
+    preview = app._live_match_preview_lines
+    assert len(preview) == limit
+    assert preview[0] == ("one.log", 5, "hit")
+    assert app._live_match_total == limit + 5
+
+    written: list[str] = []
+    monkeypatch.setattr(app, "_write_output_text", written.append)
+    app._refresh_live_output()
+    assert "\none.log:5: hit\n" in written[0]
+    assert "one.log:4: hit" not in written[0]
+
+
+def test_live_output_appends_completed_targets_text(tmp_path, monkeypatch):
+    app = LogBrowser(logs_dir=tmp_path)
+    app._search_in_progress = True
+    app._live_progress_label = "Searching 2/2 log(s): two.log"
+    written: list[str] = []
+    monkeypatch.setattr(app, "_write_output_text", written.append)
+
+    app._append_live_rendered_lines(["one", "two"])
+    app._append_live_rendered_lines([])
+    app._append_live_rendered_lines(["three"])
+    app._refresh_live_output()
+
+    bar = ui_app_module._progress_bar(0)
+    assert written == [
+        "\n".join(
+            [
+                "[progress]",
+                f"{bar}   0%",
+                "Searching 2/2 log(s): two.log",
+                "",
+                "[completed targets]",
+                "",
+                "one",
+                "two",
+                "three",
+            ]
+        )
+    ]
+
 
 def test_write_output_lines_skips_duplicate_payloads(tmp_path):
     logs_dir = tmp_path / "logs"
@@ -1395,7 +1868,7 @@ async def test_parallel_search_uses_process_fallback_before_serial(
 
     app = LogBrowser(logs_dir=logs_dir, staging_dir=staging_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         infos = app._logs_by_kind["smtp"]
         app.current_kind = "smtp"
         app.selected_logs = [infos[1], infos[0]]
@@ -1413,32 +1886,31 @@ async def test_parallel_search_uses_process_fallback_before_serial(
 
         app.call_from_thread = _direct
 
-        class _Worker:
-            is_cancelled = False
-
         def _process_success(
             request,
             targets,
             *,
             workers,
+            executor=None,
+            cancel_signal=None,
             is_cancelled=None,
             on_result=None,
             on_completed=None,
         ):
-            _ = workers
+            _ = workers, executor, cancel_signal
             results = []
             total = len(targets)
             for index, target in enumerate(targets):
                 if is_cancelled is not None and is_cancelled():
                     raise AssertionError("cancelled unexpectedly")
-                result = ui_app_module._search_single_target(
+                [result] = ui_app_module._search_target_chunk(
                     request.kind,
-                    target,
                     request.term,
                     request.mode,
                     request.fuzzy_threshold,
                     request.ignore_case,
                     request.use_index_cache,
+                    [target],
                 )
                 results.append(result)
                 if on_result is not None:
@@ -1453,6 +1925,8 @@ async def test_parallel_search_uses_process_fallback_before_serial(
             _process_success,
         )
 
+        monkeypatch.setattr(app, "_get_search_pool", lambda _workers: None)
+
         def _fail_serial(*_args, **_kwargs):
             raise AssertionError("serial fallback should not run")
 
@@ -1462,7 +1936,7 @@ async def test_parallel_search_uses_process_fallback_before_serial(
             request.source_paths,
             workers=2,
             search_fn=search_fn,
-            worker=_Worker(),
+            worker=_idle_worker(),
         )
         names = [result.log_path.name for result in results]
         assert names == [
@@ -1473,52 +1947,399 @@ async def test_parallel_search_uses_process_fallback_before_serial(
         assert "process fallback" in app._live_execution_label
 
 
-@pytest.mark.asyncio
-async def test_worker_error_stays_on_results_and_shows_message(tmp_path):
+def test_parallel_search_skips_process_pool_for_small_workload(
+    tmp_path,
+    monkeypatch,
+):
     logs_dir = tmp_path / "logs"
     write_sample_logs(logs_dir)
+    target = logs_dir / "2024.01.01-smtpLog.log"
     app = LogBrowser(logs_dir=logs_dir)
-    async with app.run_test() as pilot:
-        app._show_step_results()
-        app._set_search_running(True)
-        await pilot.pause()
-
-        class _WorkerStub:
-            error = ValueError("boom")
-            result = None
+    app.call_from_thread = lambda f, *a: f(*a)  # type: ignore[method-assign]
+    monkeypatch.setattr(app, "_notify", lambda _message: None)
+    monkeypatch.setattr(
+        ui_app_module,
+        "_search_targets_in_thread_pool",
+        lambda *args, **kwargs: (_ for _ in ()).throw(RuntimeError()),
+    )
 
-        worker = _WorkerStub()
-        app._search_worker = worker
+    def _fail_process(*_args, **_kwargs):
+        raise AssertionError("process pool should be skipped")
 
-        class _EventStub:
-            def __init__(self) -> None:
-                self.worker = worker
-                self.state = ui_app_module.WorkerState.ERROR
+    serial_calls: list[list[Path]] = []
+    monkeypatch.setattr(app, "_run_process_pool_search", _fail_process)
+    monkeypatch.setattr(
+        app,
+        "_search_targets_serial",
+        lambda _request, targets, *_a, **_k: serial_calls.append(targets),
+    )
 
-        app.on_worker_state_changed(_EventStub())
-        await pilot.pause()
+    app._search_targets_parallel(
+        SimpleNamespace(mode="literal"),  # type: ignore[arg-type]
+        [target, target],
+        2,
+        None,
+        _idle_worker(),  # type: ignore[arg-type]
+        workload_bytes=1024,
+    )
 
-        assert app.step == WizardStep.RESULTS
-        text = app._get_full_results_text() or ""
-        assert "[search error]" in text
-        assert "boom" in text
+    assert serial_calls == [[target, target]]
+    assert app._live_execution_label is not None
+    assert "small workload" in app._live_execution_label
 
 
-@pytest.mark.asyncio
-async def test_live_result_stream_keeps_target_order(tmp_path):
+def test_parallel_fuzzy_search_starts_on_process_pool(tmp_path, monkeypatch):
     logs_dir = tmp_path / "logs"
     write_sample_logs(logs_dir)
-    app = LogBrowser(logs_dir=logs_dir, staging_dir=tmp_path / "staging")
-    target_a = logs_dir / "2024.01.01-smtpLog.log"
-    target_b = logs_dir / "2024.01.02-smtpLog.log"
-    target_b.write_text(
-        "00:00:00 [2.2.2.2][B] Connection initiated\n",
-        encoding="utf-8",
-    )
-    result_a = SmtpSearchResult(
-        term="Connection",
-        log_path=target_a,
-        conversations=[
+    target = logs_dir / "2024.01.01-smtpLog.log"
+    app = LogBrowser(logs_dir=logs_dir)
+    app.call_from_thread = lambda f, *a: f(*a)  # type: ignore[method-assign]
+    monkeypatch.setattr(app, "_notify", lambda _message: None)
+
+    def _fail_threads(*_args, **_kwargs):
+        raise AssertionError("thread pool should not run")
+
+    process_calls: list[int] = []
+    monkeypatch.setattr(app, "_run_thread_pool_search", _fail_threads)
+    monkeypatch.setattr(
+        app,
+        "_run_process_pool_search",
+        lambda _request, _targets, workers, *_a: process_calls.append(workers)
+        or [],
+    )
+
+    app._search_targets_parallel(
+        SimpleNamespace(mode="fuzzy"),  # type: ignore[arg-type]
+        [target, target],
+        2,
+        None,
+        _idle_worker(),  # type: ignore[arg-type]
+        workload_bytes=512 * 1024 * 1024,
+    )
+
+    assert process_calls == [2]
+    assert app._live_execution_label is not None
+    assert "CPU-bound" in app._live_execution_label
+
+
+def test_parallel_fuzzy_search_tries_processes_once(tmp_path, monkeypatch):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    target = logs_dir / "2024.01.01-smtpLog.log"
+    app = LogBrowser(logs_dir=logs_dir)
+    app.call_from_thread = lambda f, *a: f(*a)  # type: ignore[method-assign]
+    monkeypatch.setattr(app, "_notify", lambda _message: None)
+    process_calls: list[int] = []
+    serial_calls: list[list[Path]] = []
+
+    def _fail_processes(_request, _targets, workers, *_args):
+        process_calls.append(workers)
+        raise OSError("spawn failed")
+
+    def _fail_threads(*_args, **_kwargs):
+        raise RuntimeError("threads failed")
+
+    monkeypatch.setattr(app, "_run_process_pool_search", _fail_processes)
+    monkeypatch.setattr(app, "_run_thread_pool_search", _fail_threads)
+    monkeypatch.setattr(
+        app,
+        "_search_targets_serial",
+        lambda _request, targets, *_a, **_k: serial_calls.append(targets)
+        or [],
+    )
+
+    app._search_targets_parallel(
+        SimpleNamespace(mode="fuzzy"),  # type: ignore[arg-type]
+        [target, target],
+        2,
+        None,
+        _idle_worker(),  # type: ignore[arg-type]
+        workload_bytes=512 * 1024 * 1024,
+    )
+
+    assert process_calls == [2]
+    assert serial_calls == [[target, target]]
+    assert app._live_execution_label == (
+        "serial (parallel fallback: RuntimeError, OSError)"
+    )
+
+
+def test_parallel_callbacks_deliver_results_in_one_ui_call(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    target = logs_dir / "2024.01.01-smtpLog.log"
+    app = LogBrowser(logs_dir=logs_dir)
+    crossings: list[str] = []
+
+    def _call_from_thread(f, *a):
+        crossings.append(f.__name__)
+        return f(*a)
+
+    app.call_from_thread = _call_from_thread  # type: ignore[method-assign]
+    app._notify_search_progress = (  # type: ignore[method-assign]
+        lambda *_args: None
+    )
+    delivered: list[int] = []
+    buffer_result, flush = app._parallel_callbacks(
+        lambda index, _target, _result: delivered.append(index),
+    )
+    result = object()
+
+    buffer_result(0, target, result)  # type: ignore[arg-type]
+    buffer_result(1, target, result)  # type: ignore[arg-type]
+    assert delivered == []
+    flush(2, 2, target)
+
+    assert delivered == [0, 1]
+    assert crossings == ["_apply_parallel_batch"]
+
+
+def test_parallel_callbacks_skip_unchanged_progress(tmp_path, monkeypatch):
+    target = tmp_path / "one.log"
+    app = LogBrowser(logs_dir=tmp_path)
+    batches: list[tuple[list[int], int]] = []
+
+    def _call_from_thread(_f, _on_result, items, done, _count, _name):
+        batches.append(([index for index, _t, _r in items], done))
+
+    monkeypatch.setattr(app, "call_from_thread", _call_from_thread)
+    monkeypatch.setattr(ui_app_module.time, "monotonic_ns", lambda: 0)
+    buffer_result, flush = app._parallel_callbacks(None)
+    result = object()
+
+    for done in (1, 2, 3, 300):
+        buffer_result(done - 1, target, result)  # type: ignore[arg-type]
+        flush(done, 300, target)
+
+    assert batches == [([0], 1), ([1, 2], 3), ([299], 300)]
+
+
+def test_search_process_pool_is_reused_until_unmount(tmp_path, monkeypatch):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    created: list[object] = []
+
+    class _Pool:
+        def __init__(self, workers: int) -> None:
+            self.workers = workers
+            self.shutdowns: list[dict[str, bool]] = []
+            created.append(self)
+
+        def shutdown(self, **kwargs: bool) -> None:
+            self.shutdowns.append(kwargs)
+
+    monkeypatch.setattr(ui_app_module, "_new_search_process_pool", _Pool)
+    app = LogBrowser(logs_dir=logs_dir)
+
+    first = app._get_search_pool(2)
+    assert app._get_search_pool(2) is first
+    assert app._get_search_pool(1) is first
+
+    grown = app._get_search_pool(4)
+    assert grown is not first
+    assert first.shutdowns == [{"wait": False, "cancel_futures": True}]
+
+    app.on_unmount()
+    assert grown.shutdowns == [{"wait": False, "cancel_futures": True}]
+    assert app._search_pool is None
+    assert len(created) == 2
+
+
+def test_search_thread_pools_are_reused_per_worker_count(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    app = LogBrowser(logs_dir=logs_dir)
+
+    two = app._get_thread_pool(2)
+    assert app._get_thread_pool(2) is two
+    four = app._get_thread_pool(4)
+    assert four is not two
+
+    app.on_unmount()
+    assert app._thread_pools == {}
+    with pytest.raises(RuntimeError):
+        two.submit(int)
+
+
+def test_target_chunk_bounds_cover_targets_in_order():
+    assert ui_app_module._target_chunk_bounds(3, 2) == [
+        (0, 1),
+        (1, 2),
+        (2, 3),
+    ]
+    bounds = ui_app_module._target_chunk_bounds(40, 2)
+    assert bounds[0] == (0, 5)
+    assert bounds[-1] == (35, 40)
+    assert len(bounds) == 8
+
+
+def test_process_pool_search_leaves_injected_executor_running(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    target = logs_dir / "2024.01.01-smtpLog.log"
+    request = _smtp_request(target)
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        results = ui_app_module._search_targets_in_process_pool(
+            request,
+            [target, target],
+            workers=1,
+            executor=executor,
+        )
+        assert [result.log_path for result in results] == [target, target]
+        assert executor.submit(lambda: "alive").result() == "alive"
+    finally:
+        executor.shutdown()
+
+
+def test_thread_pool_search_bounds_queued_tasks(tmp_path, monkeypatch):
+    target = tmp_path / "2024.01.01-smtpLog.log"
+    monkeypatch.setattr(
+        ui_app_module,
+        "_search_target_chunk",
+        lambda *args: [str(path) for path in args[-1]],
+    )
+    request = _smtp_request(target)
+    outstanding: list[Future] = []
+    peak = 0
+
+    class _RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, *args, **kwargs):  # type: ignore[override]
+            nonlocal peak
+            future = super().submit(*args, **kwargs)
+            outstanding.append(future)
+            pending = [item for item in outstanding if not item.done()]
+            peak = max(peak, len(pending))
+            return future
+
+    executor = _RecordingExecutor(max_workers=2)
+    try:
+        results = ui_app_module._search_targets_in_thread_pool(
+            request,
+            [target] * 20,
+            workers=2,
+            executor=executor,
+        )
+    finally:
+        executor.shutdown()
+
+    assert results == [str(target)] * 20
+    assert len(outstanding) == 20
+    assert peak <= 4
+
+
+def test_thread_pool_search_wakes_on_cancel_signal(tmp_path, monkeypatch):
+    target = tmp_path / "2024.01.01-smtpLog.log"
+    release = threading.Event()
+
+    def _blocking_search(*_args):
+        release.wait(5)
+        raise AssertionError("search should have been abandoned")
+
+    monkeypatch.setattr(
+        ui_app_module,
+        "_search_target_chunk",
+        _blocking_search,
+    )
+    request = _smtp_request(target)
+    cancel_signal: Future = Future()
+    executor = ThreadPoolExecutor(max_workers=1)
+    threading.Timer(0.05, cancel_signal.set_result, args=(None,)).start()
+    started = time.monotonic()
+    try:
+        with pytest.raises(WorkerCancelled):
+            ui_app_module._search_targets_in_thread_pool(
+                request,
+                [target],
+                workers=1,
+                executor=executor,
+                cancel_signal=cancel_signal,
+            )
+        assert time.monotonic() - started < 0.5
+    finally:
+        release.set()
+        executor.shutdown()
+
+
+def test_owned_pool_cancel_does_not_join_running_search(
+    tmp_path,
+    monkeypatch,
+):
+    target = tmp_path / "2024.01.01-smtpLog.log"
+    release = threading.Event()
+
+    def _blocking_search(*_args):
+        release.wait(5)
+        return []
+
+    monkeypatch.setattr(
+        ui_app_module,
+        "_search_target_chunk",
+        _blocking_search,
+    )
+    request = _smtp_request(target)
+    cancel_signal: Future = Future()
+    threading.Timer(0.05, cancel_signal.set_result, args=(None,)).start()
+    started = time.monotonic()
+    try:
+        with pytest.raises(WorkerCancelled):
+            ui_app_module._search_targets_in_thread_pool(
+                request,
+                [target],
+                workers=1,
+                cancel_signal=cancel_signal,
+            )
+        assert time.monotonic() - started < 0.5
+    finally:
+        release.set()
+
+
+@pytest.mark.asyncio
+async def test_worker_error_stays_on_results_and_shows_message(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    app = LogBrowser(logs_dir=logs_dir)
+    async with app.run_test() as pilot:
+        app._show_step_results()
+        app._set_search_running(True)
+        await pilot.pause()
+
+        class _WorkerStub:
+            error = ValueError("boom")
+            result = None
+
+        worker = _WorkerStub()
+        app._search_worker = worker
+
+        class _EventStub:
+            def __init__(self) -> None:
+                self.worker = worker
+                self.state = ui_app_module.WorkerState.ERROR
+
+        app.on_worker_state_changed(_EventStub())
+        await pilot.pause()
+
+        assert app.step == WizardStep.RESULTS
+        text = app._get_full_results_text() or ""
+        assert "[search error]" in text
+        assert "boom" in text
+
+
+@pytest.mark.asyncio
+async def test_live_result_stream_keeps_target_order(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    app = LogBrowser(logs_dir=logs_dir, staging_dir=tmp_path / "staging")
+    target_a = logs_dir / "2024.01.01-smtpLog.log"
+    target_b = logs_dir / "2024.01.02-smtpLog.log"
+    target_b.write_text(
+        "00:00:00 [2.2.2.2][B] Connection initiated\n",
+        encoding="utf-8",
+    )
+    result_a = SmtpSearchResult(
+        term="Connection",
+        log_path=target_a,
+        conversations=[
             Conversation(
                 message_id="A",
                 lines=["00:00:00 [1.1.1.1][A] Connection initiated"],
@@ -1601,7 +2422,7 @@ async def test_plain_question_mark_remains_input_text(tmp_path):
     write_sample_logs(logs_dir)
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app.selected_logs = infos[:1]
@@ -1622,7 +2443,7 @@ async def test_date_step_enter_switches_to_highlighted_day(tmp_path):
     )
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app._show_step_date()
@@ -1641,6 +2462,62 @@ async def test_date_step_enter_switches_to_highlighted_day(tmp_path):
         ]
 
 
+@pytest.mark.asyncio
+async def test_date_list_posts_only_selection_changes(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs_for_dates(
+        logs_dir,
+        ["2024.01.03", "2024.01.02", "2024.01.01"],
+    )
+    app = LogBrowser(logs_dir=logs_dir)
+    async with app.run_test() as pilot:
+        await _wait_for_log_scan(app, pilot)
+        kind, infos = next(iter(app._logs_by_kind.items()))
+        app.current_kind = kind
+        app._show_step_date()
+        await pilot.pause()
+
+        date_list = app.date_list
+        assert date_list is not None
+        posted = []
+        original_post = date_list.post_message
+
+        def record(message):
+            posted.append(message)
+            return original_post(message)
+
+        date_list.post_message = record  # type: ignore[method-assign]
+        await pilot.press("down", "up")
+        await pilot.pause()
+        assert not any(
+            isinstance(message, ui_app_module.DateSelectionChanged)
+            for message in posted
+        )
+
+        await pilot.press("down", "space")
+        await pilot.pause()
+        assert [info.path.name for info in app.selected_logs] == [
+            infos[0].path.name,
+            infos[1].path.name,
+        ]
+
+
+def test_button_handlers_resolve_to_app_methods():
+    for button_id, name in LogBrowser._BUTTON_HANDLERS.items():
+        assert callable(getattr(LogBrowser, name, None)), button_id
+    assert LogBrowser._BUTTONS_ALLOWED_DURING_SEARCH <= set(
+        LogBrowser._BUTTON_HANDLERS
+    )
+
+
+def test_date_item_label_formats_stamp_and_zip_suffix():
+    stamp = date(2024, 1, 3)
+    assert ui_app_module._date_item_label(stamp, False) == "2024.01.03"
+    assert ui_app_module._date_item_label(stamp, True) == (
+        "2024.01.03 (zip)"
+    )
+
+
 def test_date_step_heading_prefers_wrap_before_default_note(tmp_path):
     logs_dir = tmp_path / "logs"
     write_sample_logs(logs_dir)
@@ -1666,7 +2543,7 @@ async def test_date_step_mouse_click_toggles_clicked_day_once(tmp_path):
     )
     app = LogBrowser(logs_dir=logs_dir)
     async with app.run_test() as pilot:
-        app._refresh_logs()
+        await _wait_for_log_scan(app, pilot)
         kind, infos = next(iter(app._logs_by_kind.items()))
         app.current_kind = kind
         app._show_step_date()
@@ -1685,6 +2562,95 @@ async def test_date_step_mouse_click_toggles_clicked_day_once(tmp_path):
         ]
 
 
+@pytest.mark.asyncio
+async def test_date_list_visual_state_tracks_toggles(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs_for_dates(
+        logs_dir,
+        ["2024.01.03", "2024.01.02", "2024.01.01"],
+    )
+    app = LogBrowser(logs_dir=logs_dir)
+    async with app.run_test() as pilot:
+        await _wait_for_log_scan(app, pilot)
+        kind, infos = next(iter(app._logs_by_kind.items()))
+        app.current_kind = kind
+        app._show_step_date()
+        await pilot.pause()
+
+        date_list = app.date_list
+        assert date_list is not None
+        date_list._toggle_index(2)
+        date_list.index = 2
+        date_list._update_visual_state()
+        date_list._toggle_index(0)
+        date_list._update_visual_state()
+
+        assert date_list.selected_indices == {2}
+        assert date_list.selected_infos == [infos[2]]
+        items = list(date_list.children)
+        assert [item.has_class("selected") for item in items] == [
+            False,
+            False,
+            True,
+        ]
+        assert [item.has_class("active") for item in items] == [
+            False,
+            False,
+            True,
+        ]
+
+
+@pytest.mark.asyncio
+async def test_mnemonic_footer_key_reuses_label_between_paints(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    app = LogBrowser(logs_dir=logs_dir)
+    async with app.run_test() as pilot:
+        key = ui_app_module.MnemonicFooterKey(
+            "q",
+            "q",
+            "Quit",
+            "quit",
+            mnemonic_index=0,
+        )
+        await app.screen.mount(key)
+        await pilot.pause()
+
+        first = key.render()
+        first.stylize("italic")
+        second = key.render()
+
+        assert second.plain == "q Quit"
+        assert key._render_text is not None
+        assert second is not key._render_text
+        assert second.spans == key._render_text.spans
+        assert all("italic" not in str(span.style) for span in second.spans)
+
+
+@pytest.mark.asyncio
+async def test_footer_refreshes_coalesce_within_a_frame(tmp_path):
+    logs_dir = tmp_path / "logs"
+    write_sample_logs(logs_dir)
+    app = LogBrowser(logs_dir=logs_dir)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        assert app.footer is not None
+        refreshes = []
+        original_apply = app._apply_footer_refresh
+
+        def record():
+            refreshes.append(True)
+            original_apply()
+
+        app._apply_footer_refresh = record  # type: ignore[method-assign]
+        for _ in range(3):
+            app._refresh_footer_bindings()
+        await pilot.pause()
+
+        assert len(refreshes) == 1
+        assert not app._footer_refresh_pending
+
+
 @pytest.mark.asyncio
 async def test_startup_applies_configured_theme_when_available(tmp_path):
     logs_dir = tmp_path / "logs"
@@ -1768,3 +2734,341 @@ async def test_theme_change_persists_to_config_file(tmp_path):
 
     saved = config_module.load_config(cfg_path)
     assert saved.theme == "Cybernotdark"
+
+
+def test_unstaged_search_targets_share_request_paths(tmp_path):
+    app = LogBrowser(logs_dir=tmp_path, staging_dir=tmp_path / "staging")
+    request = _smtp_request(
+        tmp_path / "sub.log",
+        result_mode=RESULT_MODE_MATCHING_ROWS,
+    )
+
+    targets = app._stage_targets(request, SimpleNamespace())
+    assert targets is request.source_paths
+
+
+def test_staging_progress_is_throttled(tmp_path, monkeypatch):
+    app = LogBrowser(logs_dir=tmp_path, staging_dir=tmp_path / "staging")
+    sources = tuple(tmp_path / f"{day}.log" for day in range(5))
+    request = _smtp_request(
+        *sources,
+        result_mode=RESULT_MODE_MATCHING_ROWS,
+        needs_staging=True,
+        use_index_cache=True,
+    )
+    progress: list[int] = []
+
+    def _call_from_thread(callback, *args):
+        if callback == app._notify_search_progress:
+            progress.append(args[1])
+
+    monkeypatch.setattr(app, "call_from_thread", _call_from_thread)
+    monkeypatch.setattr(ui_app_module.time, "monotonic_ns", lambda: 0)
+    monkeypatch.setattr(
+        ui_app_module,
+        "stage_log",
+        lambda path, staging_dir: SimpleNamespace(staged_path=path),
+    )
+
+    targets = app._stage_targets(
+        request,
+        _idle_worker(),
+    )
+
+    assert list(targets) == list(sources)
+    assert progress == [1, 5]
+
+
+def test_check_action_gates_search_step_actions(tmp_path):
+    app = LogBrowser(logs_dir=tmp_path)
+    app.step = WizardStep.DATE
+    assert app.check_action("focus_search", ()) is False
+    assert app.check_action("quit", ()) is True
+
+    app.step = WizardStep.SEARCH
+    app.search_mode = "literal"
+    assert app.check_action("focus_search", ()) is True
+    assert app.check_action("raise_fuzzy_threshold", ()) is False
+
+    app.search_mode = "fuzzy"
+    assert app.check_action("lower_fuzzy_threshold", ()) is True
+
+
+def test_live_matches_flush_on_batch_size_or_progress(monkeypatch):
+    batches: list[int] = []
+    progress: list[int] = []
+
+    app = SimpleNamespace(
+        call_from_thread=lambda _callback, *args: progress.append(args[-2]),
+        post_message=lambda message: batches.append(len(message.batch)),
+        _notify_target_search_progress="progress",
+        _live_batch_slots=threading.Semaphore(8),
+    )
+    monkeypatch.setattr(ui_app_module, "_LIVE_MATCH_BATCH_SIZE", 3)
+    callbacks = ui_app_module._LiveTargetCallbacks(
+        app,
+        _idle_worker(),
+        index=1,
+        total=1,
+        target_name="one.log",
+    )
+
+    for line_number in range(4):
+        callbacks.report_match(line_number, "hit")
+    assert batches == [3]
+
+    callbacks.report_progress(10, 20)
+    assert batches == [3, 1]
+    assert progress == [10]
+
+    callbacks.flush()
+    assert batches == [3, 1]
+
+
+def test_live_output_tick_drains_partial_match_batches(tmp_path):
+    app = LogBrowser(logs_dir=tmp_path)
+    posted: list[list[tuple[int, str]]] = []
+    app.post_message = (  # type: ignore[method-assign]
+        lambda message: posted.append(message.batch) or True
+    )
+    callbacks = ui_app_module._LiveTargetCallbacks(
+        app,
+        _idle_worker(),
+        index=1,
+        total=1,
+        target_name="one.log",
+    )
+    app._live_match_source = callbacks
+
+    callbacks.report_match(1, "slow hit")
+    app._on_live_output_tick()
+    assert posted == [[(1, "slow hit")]]
+
+    app._live_batch_slots = threading.Semaphore(0)
+    callbacks.report_match(2, "queued")
+    app._on_live_output_tick()
+    assert posted == [[(1, "slow hit")]]
+    assert callbacks._pending_matches == [(2, "queued")]
+
+
+def test_live_match_flush_waits_while_ui_is_behind(monkeypatch):
+    posted: list[object] = []
+    app = SimpleNamespace(
+        post_message=lambda message: posted.append(message) or True,
+        _live_batch_slots=threading.Semaphore(1),
+    )
+    worker = _idle_worker()
+    monkeypatch.setattr(ui_app_module, "_LIVE_MATCH_BATCH_SIZE", 1)
+    monkeypatch.setattr(ui_app_module, "_SEARCH_CANCEL_POLL_SECONDS", 0.01)
+    callbacks = ui_app_module._LiveTargetCallbacks(
+        app,
+        worker,
+        index=1,
+        total=1,
+        target_name="one.log",
+    )
+
+    callbacks.report_match(1, "first")
+    blocked = threading.Thread(target=callbacks.report_match, args=(2, "x"))
+    blocked.start()
+    blocked.join(0.05)
+    assert blocked.is_alive()
+    assert len(posted) == 1
+
+    app._live_batch_slots.release()
+    blocked.join(1)
+    assert not blocked.is_alive()
+    assert len(posted) == 2
+    assert posted[0].worker is worker
+
+    worker.is_cancelled = True
+    callbacks.report_match(3, "dropped")
+    assert len(posted) == 2
+
+
+@pytest.mark.parametrize(
+    ("result_mode", "expected"),
+    [
+        ("related", "a1\na2\norphan\n"),
+        (RESULT_MODE_MATCHING_ROWS, "row\n"),
+    ],
+)
+def test_subsearch_snapshot_streams_result_lines(
+    tmp_path,
+    result_mode,
+    expected,
+):
+    app = LogBrowser(logs_dir=tmp_path, staging_dir=tmp_path / "staging")
+    result = SmtpSearchResult(
+        term="a",
+        log_path=tmp_path / "one.log",
+        conversations=[
+            Conversation(message_id="1", first_line_number=1, lines=[]),
+            Conversation(
+                message_id="2",
+                first_line_number=2,
+                lines=["a1", "a2"],
+            ),
+        ],
+        total_lines=4,
+        orphan_matches=[(4, "orphan")],
+        matching_rows=[(2, "row")],
+    )
+
+    app._write_subsearch_snapshot([result], "a", "smtp", [], result_mode, [])
+
+    assert app.subsearch_path is not None
+    assert app.subsearch_path.read_text(encoding="utf-8") == expected
+
+
+def test_final_results_reuse_live_rendered_targets(tmp_path, monkeypatch):
+    app = LogBrowser(logs_dir=tmp_path)
+    monkeypatch.setattr(app, "_notify", lambda _message: None)
+    app._live_kind = "smtp"
+    app._live_result_mode = "related"
+    targets = [tmp_path / "one.log", tmp_path / "two.log"]
+    results = [
+        SmtpSearchResult(
+            term="hit",
+            log_path=target,
+            conversations=[],
+            total_lines=1,
+            orphan_matches=[(1, f"hit in {target.name}")],
+        )
+        for target in targets
+    ]
+
+    app._on_live_search_result(1, targets[1], results[1])
+    app._on_live_search_result(0, targets[0], results[0])
+    output = SearchOutput(
+        kind="smtp",
+        term="hit",
+        result_mode="related",
+        targets=targets,
+        results=results,
+    )
+
+    view = app._live_result_view(output)
+    expected = app._render_result_view(results, targets, "smtp", "related")
+    assert view == expected
+
+    app._live_result_mode = RESULT_MODE_MATCHING_ROWS
+    assert app._live_result_view(output) is None
+
+
+def test_list_log_files_skips_hidden_entries_and_directories(tmp_path):
+    (tmp_path / "b.log").write_text("b", encoding="utf-8")
+    (tmp_path / "a.log").write_text("a", encoding="utf-8")
+    (tmp_path / ".hidden.log").write_text("h", encoding="utf-8")
+    (tmp_path / "archive").mkdir()
+
+    assert ui_app_module.list_log_files(tmp_path) == [
+        tmp_path / "a.log",
+        tmp_path / "b.log",
+    ]
+    assert ui_app_module.list_log_files(tmp_path / "missing") == []
+
+
+def test_index_warmup_probes_targets_off_the_ui_thread(tmp_path, monkeypatch):
+    app = LogBrowser(logs_dir=tmp_path)
+    targets = [tmp_path / "one.log", tmp_path / "two.log"]
+    probed: list[Path] = []
+    primed: list[Path] = []
+    jobs: list[object] = []
+
+    monkeypatch.setattr(
+        ui_app_module,
+        "has_search_index",
+        lambda path, _kind: probed.append(path) or path == targets[0],
+    )
+    monkeypatch.setattr(
+        ui_app_module,
+        "prime_search_index",
+        lambda path, _kind: primed.append(path),
+    )
+    monkeypatch.setattr(
+        app,
+        "run_worker",
+        lambda job, **_kwargs: jobs.append(job),
+    )
+    monkeypatch.setattr(
+        ui_app_module,
+        "get_current_worker",
+        _idle_worker,
+    )
+
+    app._schedule_index_warmup("smtp", targets)
+    assert probed == []
+
+    [job] = jobs
+    job()  # type: ignore[operator]
+    assert probed == targets
+    assert primed == [targets[1]]
+
+
+def test_live_match_batches_drop_after_target_or_search_ends(
+    tmp_path,
+    monkeypatch,
+):
+    app = LogBrowser(logs_dir=tmp_path)
+    applied: list[int] = []
+    monkeypatch.setattr(
+        app,
+        "_on_live_target_match_batch",
+        lambda current, _total, _name, _batch: applied.append(current),
+    )
+    worker = object()
+    stale_worker = object()
+    app._search_in_progress = True
+    app._search_worker = worker  # type: ignore[assignment]
+    app._live_next_index = 1
+
+    def batch(source, current, name):
+        return ui_app_module.LiveMatchBatch(source, current, 2, name, [])
+
+    app.on_live_match_batch(batch(worker, 1, "a"))
+    app.on_live_match_batch(batch(stale_worker, 2, "b"))
+    app.on_live_match_batch(batch(worker, 2, "b"))
+    app._search_in_progress = False
+    app.on_live_match_batch(batch(worker, 2, "b"))
+
+    assert applied == [2]
+
+
+def test_full_results_text_is_joined_once_per_result_set(tmp_path):
+    app = LogBrowser(logs_dir=tmp_path)
+    app.last_rendered_lines = ["alpha", "beta", ""]
+
+    first = app._get_full_results_text()
+    assert first == "alpha\nbeta"
+    assert app._get_full_results_text() is first
+
+    app.last_rendered_lines = ["gamma"]
+    assert app._get_full_results_text() == "gamma"
+
+
+def test_log_prefetch_reads_selected_logs_until_cancelled(
+    tmp_path,
+    monkeypatch,
+):
+    app = LogBrowser(logs_dir=tmp_path)
+    first = tmp_path / "one.log"
+    second = tmp_path / "two.log"
+    first.write_bytes(b"x" * 10)
+    second.write_bytes(b"y" * 10)
+    worker = _idle_worker()
+    reads: list[str] = []
+    real_open = Path.open
+
+    def _open(path, *args, **kwargs):
+        reads.append(path.name)
+        worker.is_cancelled = path == second
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(ui_app_module, "get_current_worker", lambda: worker)
+    monkeypatch.setattr(Path, "open", _open)
+    monkeypatch.setattr(ui_app_module, "_PREFETCH_READ_BYTES", 4)
+
+    app._run_log_prefetch_job([tmp_path / "missing.log", first, second, first])
+
+    assert reads == ["missing.log", "one.log", "two.log"]